@@ -18,17 +18,26 @@ Version: 2.4.1
 """
 
 import argparse
+import csv
+import fcntl
 import fnmatch
 import json
 import logging
+import multiprocessing
 import os
+import re
 import shutil
 import signal
 import sqlite3
 import sys
 import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import partial
+from itertools import islice
+from operator import attrgetter, itemgetter
 
 # Optional: inotify for daemon mode (may not be installed)
 try:
@@ -49,6 +58,49 @@ BACKUP_DIR = os.path.expanduser("~/kismet/backups")
 LOG_FILE = "/var/log/warpie/filter-processor.log"
 DAEMON_INTERVAL = 60  # seconds between processing runs
 
+# One filter_rules.conf line: a [section] header or a value|type[|description]
+# entry. Surrounding whitespace and "#" comment lines are skipped, and fields
+# past the description are ignored, mirroring line.strip().split("|").
+_CONFIG_LINE_RE = re.compile(
+    r"""
+    ^[^\S\n]*+
+    (?:
+        \[(?P<section>[^\n]*)\]
+      | (?!\#)(?P<value>[^|\n]*)\|(?P<type>[^|\n]*?)
+        (?:\|(?P<desc>[^|\n]*?)(?:\|[^\n]*?)?)?
+    )
+    [^\S\n]*$
+    """,
+    re.MULTILINE | re.VERBOSE,
+)
+
+# Parsed exclusions per config path: (stat signature, static rules, dynamic rules)
+_EXCLUSIONS_CACHE: dict[str, tuple[tuple[int, int, int], list, list]] = {}
+
+# Common suffix of the advertised/probed SSID keys in kismetdb device JSON
+_SSID_KEY_MARKER = 'ssid.ssid"'
+_SSID_KEY_MARKER_BYTES = _SSID_KEY_MARKER.encode()
+
+# Opening bracket of each SSID map array, with the SSID key its entries use.
+# Other records also carry SSID keys (last_beaconed_ssid_record,
+# responded_ssid_map), so only these two arrays are decoded.
+_SSID_MAPS = (
+    (re.compile(r'"dot11\.device\.advertised_ssid_map"\s*:\s*\['), "dot11.advertisedssid.ssid"),
+    (re.compile(r'"dot11\.device\.probed_ssid_map"\s*:\s*\['), "dot11.probedssid.ssid"),
+)
+_JSON_DECODER = json.JSONDecoder()
+
+# Characters a JSON encoder always writes verbatim inside a string. Anything
+# else may come out \-escaped, so a raw substring search for it could miss.
+_JSON_VERBATIM_CHARS = frozenset(map(chr, range(0x20, 0x7F))) - frozenset("\"\\/<>&'")
+
+# Linux FICLONE ioctl: clone a file's extents copy-on-write (btrfs, XFS)
+_FICLONE = getattr(fcntl, "FICLONE", 0x40049409)
+
+# Max values bound per batched DELETE (older SQLite builds cap a statement at
+# 999 parameters)
+SQLITE_BATCH_SIZE = 500
+
 # WiGLE CSV columns (1.4 format)
 WIGLE_MAC_COL = 0
 WIGLE_SSID_COL = 1
@@ -89,6 +141,13 @@ class FilterRule:
     value: str
     match_type: str  # exact, pattern
     description: str = ""
+    # Glob compiled once for pattern rules, so matching skips fnmatch's
+    # per-call translation and cache lookup
+    _compiled: re.Pattern | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        if self.match_type == "pattern":
+            self._compiled = re.compile(fnmatch.translate(self.value))
 
 
 @dataclass
@@ -148,56 +207,70 @@ def setup_logging(log_file: str | None = None, verbose: bool = False):
 # =============================================================================
 
 
-def load_dynamic_exclusions(config_path: str = CONFIG_FILE) -> list[FilterRule]:
+def _read_exclusions(config_path: str) -> tuple[list[FilterRule], list[FilterRule]]:
     """
-    Load dynamic exclusion rules from the filter configuration file.
-
-    Only loads [dynamic_exclusions] section - these are SSID patterns for
-    networks with rotating MACs that need post-processing removal.
-
-    Args:
-        config_path: Path to the filter_rules.conf file.
+    Parse the static and dynamic exclusion sections of a config file.
 
-    Returns:
-        List of FilterRule objects for dynamic exclusions.
+    The file is read once and swept with _CONFIG_LINE_RE, which yields only
+    section headers and value|type[|description] entries (with the same
+    whitespace, comment and extra-field handling as line.strip().split("|")),
+    so both sections come out of a single pass. Results are cached per path
+    and reused until the file's mtime, size or inode changes.
     """
-    rules = []
+    static_rules = []
+    dynamic_rules = []
 
-    if not os.path.exists(config_path):
+    try:
+        st = os.stat(config_path)
+    except FileNotFoundError:
         logging.warning(f"Config file not found: {config_path}")
-        return rules
+        return static_rules, dynamic_rules
+    except OSError as e:
+        logging.error(f"Failed to read config file: {e}")
+        return static_rules, dynamic_rules
 
-    in_section = False
+    # Unchanged file: reuse the rules parsed last time (copied, so callers
+    # can't alter the cached lists)
+    signature = (st.st_mtime_ns, st.st_size, st.st_ino)
+    cached = _EXCLUSIONS_CACHE.get(config_path)
+    if cached is not None and cached[0] == signature:
+        return list(cached[1]), list(cached[2])
 
     try:
         with open(config_path) as f:
-            for line in f:
-                line = line.strip()
+            text = f.read()
+    except OSError as e:
+        logging.error(f"Failed to read config file: {e}")
+        return static_rules, dynamic_rules
 
-                # Check for section markers
-                if line == "[dynamic_exclusions]":
-                    in_section = True
-                    continue
-                elif line.startswith("[") and line.endswith("]"):
-                    in_section = False
-                    continue
+    sections = {"static_exclusions": static_rules, "dynamic_exclusions": dynamic_rules}
+    current_rules = None
 
-                # Skip comments and empty lines
-                if not line or line.startswith("#"):
-                    continue
+    for match in _CONFIG_LINE_RE.finditer(text):
+        section = match["section"]
+        if section is not None:
+            current_rules = sections.get(section)
+        elif current_rules is not None:
+            current_rules.append(FilterRule(match["value"], match["type"], match["desc"] or ""))
 
-                # Parse entry in dynamic section
-                if in_section:
-                    parts = line.split("|")
-                    if len(parts) >= 2:
-                        value = parts[0]
-                        match_type = parts[1]
-                        description = parts[2] if len(parts) > 2 else ""
-                        rules.append(FilterRule(value, match_type, description))
+    _EXCLUSIONS_CACHE[config_path] = (signature, static_rules, dynamic_rules)
+    return list(static_rules), list(dynamic_rules)
 
-    except OSError as e:
-        logging.error(f"Failed to read config file: {e}")
 
+def load_dynamic_exclusions(config_path: str = CONFIG_FILE) -> list[FilterRule]:
+    """
+    Load dynamic exclusion rules from the filter configuration file.
+
+    Only loads [dynamic_exclusions] section - these are SSID patterns for
+    networks with rotating MACs that need post-processing removal.
+
+    Args:
+        config_path: Path to the filter_rules.conf file.
+
+    Returns:
+        List of FilterRule objects for dynamic exclusions.
+    """
+    _, rules = _read_exclusions(config_path)
     logging.info(f"Loaded {len(rules)} dynamic exclusion rules")
     return rules
 
@@ -214,50 +287,7 @@ def load_all_exclusions(
     Returns:
         Tuple of (static_rules, dynamic_rules).
     """
-    static_rules = []
-    dynamic_rules = []
-
-    if not os.path.exists(config_path):
-        logging.warning(f"Config file not found: {config_path}")
-        return static_rules, dynamic_rules
-
-    current_section = None
-
-    try:
-        with open(config_path) as f:
-            for line in f:
-                line = line.strip()
-
-                if line == "[static_exclusions]":
-                    current_section = "static"
-                    continue
-                elif line == "[dynamic_exclusions]":
-                    current_section = "dynamic"
-                    continue
-                elif line.startswith("[") and line.endswith("]"):
-                    current_section = None
-                    continue
-
-                if not line or line.startswith("#"):
-                    continue
-
-                if current_section:
-                    parts = line.split("|")
-                    if len(parts) >= 2:
-                        rule = FilterRule(
-                            value=parts[0],
-                            match_type=parts[1],
-                            description=parts[2] if len(parts) > 2 else "",
-                        )
-                        if current_section == "static":
-                            static_rules.append(rule)
-                        elif current_section == "dynamic":
-                            dynamic_rules.append(rule)
-
-    except OSError as e:
-        logging.error(f"Failed to read config file: {e}")
-
-    return static_rules, dynamic_rules
+    return _read_exclusions(config_path)
 
 
 # =============================================================================
@@ -279,8 +309,8 @@ def matches_pattern(ssid: str, rule: FilterRule) -> bool:
     if rule.match_type == "exact":
         return ssid == rule.value
     elif rule.match_type == "pattern":
-        # fnmatch handles * and ? wildcards
-        return fnmatch.fnmatch(ssid, rule.value)
+        # Precompiled fnmatch glob handles * and ? wildcards
+        return rule._compiled.match(ssid) is not None
     elif rule.match_type == "bssid":
         # BSSIDs don't match SSIDs
         return False
@@ -304,6 +334,94 @@ def find_matching_rule(ssid: str, rules: list[FilterRule]) -> FilterRule | None:
     return None
 
 
+def build_rule_matcher(rules: list[FilterRule]) -> Callable[[str], FilterRule | None]:
+    """
+    Compile rules into a single matcher for bulk SSID lookups.
+
+    Rules are split by type into parallel lookup structures: exact values go
+    into a dict (first occurrence wins) and pattern rules are fused into one
+    alternation regex with a named group per rule, in list order. Each entry
+    keeps its position in the original list, so when both an exact and a
+    pattern rule match, the earlier one is returned - the same rule as
+    find_matching_rule, without looping over the rules in Python.
+
+    Args:
+        rules: List of rules to check against.
+
+    Returns:
+        A function mapping an SSID to its first matching FilterRule or None.
+    """
+    exact: dict[str, tuple[int, FilterRule]] = {}
+    patterns: list[tuple[int, FilterRule]] = []
+    for index, rule in enumerate(rules):
+        if rule.match_type == "exact":
+            exact.setdefault(rule.value, (index, rule))
+        elif rule.match_type == "pattern":
+            patterns.append((index, rule))
+
+    if not patterns:
+        return lambda ssid: hit[1] if (hit := exact.get(ssid)) else None
+
+    combined = re.compile(
+        "|".join(
+            f"(?P<r{group}>{fnmatch.translate(rule.value)})"
+            for group, (_, rule) in enumerate(patterns)
+        )
+    )
+
+    def match(ssid: str) -> FilterRule | None:
+        hit = exact.get(ssid)
+        m = combined.match(ssid)
+        if m:
+            # lastgroup is the rule's own group: translated globs add no named groups
+            index, rule = patterns[int(m.lastgroup[1:])]
+            if hit is None or index < hit[0]:
+                return rule
+        return hit[1] if hit else None
+
+    return match
+
+
+def build_device_prefilter(rules: list[FilterRule]) -> Callable[[str | bytes], bool] | None:
+    """
+    Build a raw-JSON check that rules out devices no rule can match.
+
+    When every rule is an exact match on characters JSON never escapes, a
+    device can only match if one of the rule values appears verbatim in its
+    JSON blob. One fused regex search over the raw text then lets the
+    non-matching majority skip JSON parsing entirely. Matches still have to be
+    confirmed against the parsed SSID fields.
+
+    Args:
+        rules: List of rules to check against.
+
+    Returns:
+        A function that is False when a device blob cannot contain a matching
+        SSID, or None when the rules cannot be prefiltered safely.
+    """
+    values: dict[str, None] = {}
+    for rule in rules:
+        if rule.match_type == "pattern" or not _JSON_VERBATIM_CHARS.issuperset(rule.value):
+            return None
+        if rule.match_type == "exact" and rule.value:
+            values[rule.value] = None
+
+    alternation = "|".join(map(re.escape, values))
+    text_re = re.compile(alternation)
+    bytes_re = re.compile(alternation.encode())
+
+    def may_match(device_json: str | bytes) -> bool:
+        if not values:
+            return False
+        if isinstance(device_json, bytes):
+            return bytes_re.search(device_json) is not None
+        if isinstance(device_json, str):
+            return text_re.search(device_json) is not None
+        return False
+
+    return may_match
+
+
 # =============================================================================
 # KISMETDB PROCESSING
 # =============================================================================
@@ -319,32 +437,48 @@ def extract_ssids_from_device(device_json: str) -> list[str]:
     Returns:
         List of SSIDs found in the device data.
     """
-    ssids = []
+    # Ordered set: keeps first-seen order while deduplicating in O(1)
+    ssids: dict[str, None] = {}
 
     try:
-        device = json.loads(device_json)
-
-        # Primary SSID location
-        ssid_map = device.get("dot11.device", {}).get("dot11.device.advertised_ssid_map", [])
-
-        for ssid_entry in ssid_map:
-            if isinstance(ssid_entry, dict):
-                ssid = ssid_entry.get("dot11.advertisedssid.ssid", "")
-                if ssid:
-                    ssids.append(ssid)
-
-        # Also check probed SSIDs
-        probed_map = device.get("dot11.device", {}).get("dot11.device.probed_ssid_map", [])
-        for probed_entry in probed_map:
-            if isinstance(probed_entry, dict):
-                ssid = probed_entry.get("dot11.probedssid.ssid", "")
-                if ssid and ssid not in ssids:
-                    ssids.append(ssid)
-
-    except (json.JSONDecodeError, TypeError, KeyError):
+        # Both SSID keys ("dot11.advertisedssid.ssid", "dot11.probedssid.ssid")
+        # end in this marker. A substring scan is far cheaper than json.loads,
+        # so devices without any SSID entries skip the parse entirely.
+        marker = _SSID_KEY_MARKER_BYTES if isinstance(device_json, bytes) else _SSID_KEY_MARKER
+        if marker not in device_json:
+            return []
+
+        # Decode just the two map arrays, in advertised-then-probed order.
+        # They are a small part of a device blob, so this is cheaper than
+        # parsing the whole tree (signal RRDs, packet counters, ...).
+        if isinstance(device_json, bytes):
+            device_json = device_json.decode()
+        for map_re, ssid_key in _SSID_MAPS:
+            opening = map_re.search(device_json)
+            if opening is None:
+                continue
+            entries, _ = _JSON_DECODER.raw_decode(device_json, opening.end() - 1)
+            for entry in entries:
+                if isinstance(entry, dict):
+                    ssid = entry.get(ssid_key, "")
+                    if ssid:
+                        ssids[ssid] = None
+
+    except (json.JSONDecodeError, UnicodeDecodeError, TypeError, KeyError):
         pass
 
-    return ssids
+    return list(ssids)
+
+
+def _batches(items: list, size: int = SQLITE_BATCH_SIZE) -> Iterator[list]:
+    """Yield successive slices of items, at most size long."""
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def _placeholders(batch: list) -> str:
+    """Return the "?, ?, ..." parameter list for a batch."""
+    return ", ".join("?" * len(batch))
 
 
 def process_kismetdb(
@@ -384,13 +518,18 @@ def process_kismetdb(
 
         keys_to_remove = []
         macs_to_remove = []
+        match_rule = build_rule_matcher(rules)
+        may_match = build_device_prefilter(rules)
 
-        for key, devmac, device_json in cursor.fetchall():
+        # Stream rows instead of fetchall() so memory stays flat on large captures
+        for key, devmac, device_json in cursor:
             result.original_count += 1
+            if may_match is not None and not may_match(device_json):
+                continue
             ssids = extract_ssids_from_device(device_json)
 
             for ssid in ssids:
-                rule = find_matching_rule(ssid, rules)
+                rule = match_rule(ssid)
                 if rule:
                     keys_to_remove.append(key)
                     macs_to_remove.append(devmac)
@@ -407,32 +546,38 @@ def process_kismetdb(
         result.removed_count = len(keys_to_remove)
 
         if not dry_run and keys_to_remove:
+            # Delete in batches with one IN (...) statement each, all inside
+            # the single transaction committed below
+            unique_macs = list(dict.fromkeys(macs_to_remove))
+
             # Remove from devices table
-            for key in keys_to_remove:
-                cursor.execute("DELETE FROM devices WHERE key = ?", (key,))
+            for batch in _batches(keys_to_remove):
+                cursor.execute(
+                    f"DELETE FROM devices WHERE key IN ({_placeholders(batch)})",  # noqa: S608
+                    batch,
+                )
 
-            # Remove associated packets
-            for mac in macs_to_remove:
+            # Remove associated packets (each MAC is bound twice per statement)
+            for batch in _batches(unique_macs, SQLITE_BATCH_SIZE // 2):
+                marks = _placeholders(batch)
                 cursor.execute(
-                    """
-                    DELETE FROM packets
-                    WHERE sourcemac = ? OR destmac = ?
-                """,
-                    (mac, mac),
+                    f"DELETE FROM packets WHERE sourcemac IN ({marks}) OR destmac IN ({marks})",  # noqa: S608
+                    batch + batch,
                 )
 
             # Also clean up data_source_records if they exist
-            for mac in macs_to_remove:
-                try:
+            try:
+                for batch in _batches(unique_macs):
                     cursor.execute(
-                        """
+                        f"""
                         DELETE FROM datasources
-                        WHERE json_extract(source_json, '$.kismet.datasource.source_mac') = ?
-                    """,
-                        (mac,),
+                        WHERE json_extract(source_json, '$.kismet.datasource.source_mac')
+                            IN ({_placeholders(batch)})
+                    """,  # noqa: S608
+                        batch,
                     )
-                except sqlite3.OperationalError:
-                    pass  # Table might not exist in all versions
+            except sqlite3.OperationalError:
+                pass  # Table might not exist in all versions
 
             conn.commit()
             logging.info(f"Removed {result.removed_count} entries from {db_path}")
@@ -466,6 +611,42 @@ def scan_kismetdb(db_path: str, rules: list[FilterRule]) -> ProcessingResult:
 # =============================================================================
 
 
+def _split_quoted_wigle_row(line: bytes) -> list[bytes]:
+    """
+    Split a WiGLE CSV row containing quoted fields.
+
+    Uses the csv module's C tokenizer to unquote fields, round-tripping through
+    surrogateescape so undecodable bytes survive unchanged.
+
+    Args:
+        line: Raw CSV row.
+
+    Returns:
+        List of raw field values.
+    """
+    row = next(csv.reader([line.decode("utf-8", "surrogateescape")]), [])
+    return [value.encode("utf-8", "surrogateescape") for value in row]
+
+
+def _iter_file_lines(path: str) -> Iterator[bytes]:
+    """
+    Yield the lines of a file, line endings included, through a buffered reader.
+
+    Lines are read in chunks as they are scanned instead of the whole file
+    being copied into one bytes object, so only the lines a caller keeps stay
+    in memory. Unlike an mmap, a file truncated by another process mid-scan
+    just ends early rather than faulting.
+
+    Args:
+        path: File to read.
+
+    Yields:
+        Raw lines, each ending in a newline except possibly the last.
+    """
+    with open(path, "rb") as f:
+        yield from f
+
+
 def process_wigle_csv(
     csv_path: str, rules: list[FilterRule], dry_run: bool = False
 ) -> ProcessingResult:
@@ -488,28 +669,42 @@ def process_wigle_csv(
         return result
 
     try:
-        with open(csv_path, encoding="utf-8", errors="replace") as f:
-            lines = f.readlines()
+        # Stream the file as bytes: only the SSID and MAC fields of each row
+        # are decoded, and kept rows are written back byte-for-byte (line
+        # endings and any invalid UTF-8 included)
+        lines = _iter_file_lines(csv_path)
 
-        if len(lines) < 2:
+        # Preserve header lines (first 2 lines in WiGLE format)
+        header = list(islice(lines, 2))
+        if len(header) < 2:
             result.error = "File too short (missing header)"
             return result
 
-        # Preserve header lines (first 2 lines in WiGLE format)
-        header = lines[:2]
-        data_lines = lines[2:]
-
-        result.original_count = len(data_lines)
         filtered_lines = []
+        match_rule = build_rule_matcher(rules)
+        # A WiGLE CSV has one row per sighting, so the same SSIDs recur many
+        # times: decode and match each distinct raw SSID only once
+        verdicts: dict[bytes, FilterRule | None] = {}
 
-        for line in data_lines:
-            parts = line.split(",")
+        for line in lines:
+            result.original_count += 1
+            # Plain split for the common case, stopping after the SSID column
+            # instead of splitting every field; rows with quoted fields (SSIDs
+            # containing commas or quotes) go through the csv tokenizer
+            if b'"' in line:
+                parts = _split_quoted_wigle_row(line)
+            else:
+                parts = line.split(b",", WIGLE_SSID_COL + 1)
             if len(parts) > WIGLE_SSID_COL:
-                ssid = parts[WIGLE_SSID_COL]
+                raw_ssid = parts[WIGLE_SSID_COL]
+                if raw_ssid in verdicts:
+                    rule = verdicts[raw_ssid]
+                else:
+                    rule = verdicts[raw_ssid] = match_rule(raw_ssid.decode("utf-8", "replace"))
 
-                rule = find_matching_rule(ssid, rules)
                 if rule:
-                    mac = parts[WIGLE_MAC_COL] if len(parts) > WIGLE_MAC_COL else ""
+                    ssid = raw_ssid.decode("utf-8", "replace")
+                    mac = parts[WIGLE_MAC_COL].decode("utf-8", "replace")
                     result.matches.append(
                         {"ssid": ssid, "mac": mac, "rule": rule.value, "rule_type": rule.match_type}
                     )
@@ -521,9 +716,10 @@ def process_wigle_csv(
         result.removed_count = result.original_count - len(filtered_lines)
 
         if not dry_run and result.removed_count > 0:
-            with open(csv_path, "w", encoding="utf-8") as f:
-                f.writelines(header)
-                f.writelines(filtered_lines)
+            # Rewrite in place (keeps the file's owner and mode) with one write;
+            # the loop above exhausted the lines, so the read handle is closed
+            with open(csv_path, "wb") as f:
+                f.write(b"".join(header + filtered_lines))
             logging.info(f"Removed {result.removed_count} entries from {csv_path}")
 
     except OSError as e:
@@ -553,6 +749,28 @@ def scan_wigle_csv(csv_path: str, rules: list[FilterRule]) -> ProcessingResult:
 # =============================================================================
 
 
+def _clone_or_copy(src: str, dest: str) -> None:
+    """
+    Copy a file, sharing its data copy-on-write when the filesystem allows it.
+
+    A reflink clone is instant and takes no extra space, yet stays independent
+    of the source. Hardlinks would not: files are sanitized in place after the
+    backup is taken, which would rewrite the backup as well.
+
+    Args:
+        src: File to copy.
+        dest: Destination path.
+    """
+    try:
+        with open(src, "rb") as fsrc, open(dest, "wb") as fdst:
+            fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+    except OSError:
+        # Not supported here (ext4, tmpfs, across filesystems): plain copy
+        shutil.copy2(src, dest)
+    else:
+        shutil.copystat(src, dest)
+
+
 def create_backup(files: list[str], backup_dir: str = BACKUP_DIR) -> str:
     """
     Create a backup of files before processing.
@@ -572,7 +790,7 @@ def create_backup(files: list[str], backup_dir: str = BACKUP_DIR) -> str:
     for file_path in files:
         if os.path.exists(file_path):
             dest = os.path.join(backup_path, os.path.basename(file_path))
-            shutil.copy2(file_path, dest)
+            _clone_or_copy(file_path, dest)
             logging.debug(f"Backed up {file_path} to {dest}")
 
     logging.info(f"Created backup at {backup_path}")
@@ -606,18 +824,27 @@ def list_backups(backup_dir: str = BACKUP_DIR) -> list[dict]:
     if not os.path.exists(backup_dir):
         return backups
 
-    for name in sorted(os.listdir(backup_dir), reverse=True):
-        path = os.path.join(backup_dir, name)
-        if os.path.isdir(path):
-            files = os.listdir(path)
-            total_size = sum(
-                os.path.getsize(os.path.join(path, f))
-                for f in files
-                if os.path.isfile(os.path.join(path, f))
-            )
-            backups.append(
-                {"name": name, "path": path, "files": len(files), "size_bytes": total_size}
-            )
+    # scandir entries carry their file type, so only file sizes need a stat call
+    with os.scandir(backup_dir) as it:
+        backup_entries = sorted(
+            (entry for entry in it if entry.is_dir()), key=attrgetter("name"), reverse=True
+        )
+
+    for backup in backup_entries:
+        file_count = total_size = 0
+        with os.scandir(backup.path) as it:
+            for entry in it:
+                file_count += 1
+                if entry.is_file():
+                    total_size += entry.stat().st_size
+        backups.append(
+            {
+                "name": backup.name,
+                "path": backup.path,
+                "files": file_count,
+                "size_bytes": total_size,
+            }
+        )
 
     return backups
 
@@ -627,6 +854,43 @@ def list_backups(backup_dir: str = BACKUP_DIR) -> list[dict]:
 # =============================================================================
 
 
+def _find_files(base_dir: str, matches: Callable[[str], bool]) -> list[str]:
+    """
+    Recursively find files whose name satisfies matches, newest first.
+
+    Walks with os.scandir, whose entries already know their type, and stats
+    each matching file once for the mtime used to sort. Symlinked directories
+    are not descended into, as with os.walk.
+
+    Args:
+        base_dir: Base directory to search.
+        matches: Predicate on the file name.
+
+    Returns:
+        List of matching file paths sorted by modification time (newest first).
+    """
+    found = []
+    pending = [base_dir]
+
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        if not entry.is_symlink():
+                            pending.append(entry.path)
+                    elif matches(entry.name):
+                        try:
+                            found.append((entry.stat().st_mtime, entry.path))
+                        except OSError:
+                            pass  # Removed since the directory was listed
+        except OSError:
+            continue  # Missing or unreadable directory
+
+    found.sort(key=itemgetter(0), reverse=True)
+    return [path for _, path in found]
+
+
 def find_kismetdb_files(base_dir: str = KISMET_LOGS_DIR) -> list[str]:
     """
     Find all kismetdb files in the logs directory.
@@ -637,14 +901,7 @@ def find_kismetdb_files(base_dir: str = KISMET_LOGS_DIR) -> list[str]:
     Returns:
         List of kismetdb file paths.
     """
-    files = []
-
-    for root, _, filenames in os.walk(base_dir):
-        for filename in filenames:
-            if filename.endswith(".kismet"):
-                files.append(os.path.join(root, filename))
-
-    return sorted(files, key=os.path.getmtime, reverse=True)
+    return _find_files(base_dir, lambda name: name.endswith(".kismet"))
 
 
 def find_wigle_csv_files(base_dir: str = KISMET_LOGS_DIR) -> list[str]:
@@ -657,17 +914,11 @@ def find_wigle_csv_files(base_dir: str = KISMET_LOGS_DIR) -> list[str]:
     Returns:
         List of WiGLE CSV file paths.
     """
-    files = []
-
-    for root, _, filenames in os.walk(base_dir):
-        for filename in filenames:
-            if filename.endswith(".wiglecsv") or "wigle" in filename.lower():
-                files.append(os.path.join(root, filename))
-
-    return sorted(files, key=os.path.getmtime, reverse=True)
+    # Covers ".wiglecsv" too, so every name costs a single substring test
+    return _find_files(base_dir, lambda name: "wigle" in name.lower())
 
 
-def is_file_in_use(file_path: str) -> bool:
+def is_file_in_use(file_path: str, st: os.stat_result | None = None) -> bool:
     """
     Check if a file is currently being written to (by Kismet).
 
@@ -676,15 +927,18 @@ def is_file_in_use(file_path: str) -> bool:
 
     Args:
         file_path: Path to check.
+        st: The file's stat result, if the caller already has it.
 
     Returns:
         True if file appears to be in use.
     """
-    if not os.path.exists(file_path):
-        return False
+    if st is None:
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return False
 
-    mtime = os.path.getmtime(file_path)
-    age_seconds = time.time() - mtime
+    age_seconds = time.time() - st.st_mtime
 
     return age_seconds < 30
 
@@ -694,13 +948,16 @@ def is_file_in_use(file_path: str) -> bool:
 # =============================================================================
 
 
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+
 def format_size(size_bytes: int) -> str:
     """Format byte size as human-readable string."""
-    for unit in ["B", "KB", "MB", "GB"]:
-        if size_bytes < 1024:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024
-    return f"{size_bytes:.1f} TB"
+    # Each unit spans 10 bits, so the bit length picks it without dividing in a loop
+    exponent = 0
+    if size_bytes >= 1024:
+        exponent = min(len(_SIZE_UNITS) - 1, (int(size_bytes).bit_length() - 1) // 10)
+    return f"{size_bytes / (1 << (10 * exponent)):.1f} {_SIZE_UNITS[exponent]}"
 
 
 def print_header(text: str):
@@ -709,6 +966,24 @@ def print_header(text: str):
     print("─" * 50)
 
 
+def _scan_file(file_path: str, rules: list[FilterRule]) -> ProcessingResult | None:
+    """
+    Scan one capture file without modifying it, dispatching on its type.
+
+    Args:
+        file_path: Path to a kismetdb or WiGLE CSV file.
+        rules: Exclusion rules to apply.
+
+    Returns:
+        ProcessingResult with scan results, or None if not a capture file.
+    """
+    if file_path.endswith(".kismet"):
+        return scan_kismetdb(file_path, rules)
+    if file_path.endswith(".wiglecsv") or "wigle" in file_path.lower():
+        return scan_wigle_csv(file_path, rules)
+    return None
+
+
 def preview_sanitization(path: str, rules: list[FilterRule]) -> dict:
     """
     Preview what would be removed during sanitization.
@@ -727,20 +1002,33 @@ def preview_sanitization(path: str, rules: list[FilterRule]) -> dict:
     else:
         files = find_kismetdb_files(path) + find_wigle_csv_files(path)
 
+    # Stat each file once: the result serves the in-use check and the size
+    sizes = {}
     for file_path in files:
-        if is_file_in_use(file_path):
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            continue  # Removed since it was found
+        if is_file_in_use(file_path, st):
             logging.warning(f"Skipping {file_path} - currently in use")
-            continue
-
-        if file_path.endswith(".kismet"):
-            result = scan_kismetdb(file_path, rules)
-        elif file_path.endswith(".wiglecsv") or "wigle" in file_path.lower():
-            result = scan_wigle_csv(file_path, rules)
         else:
-            continue
+            sizes[file_path] = st.st_size
+    idle_files = list(sizes)
+
+    # Files scan independently, so spread them across the CPU cores. Forked
+    # workers inherit the loaded script, so nothing is re-imported.
+    scan = partial(_scan_file, rules=rules)
+    workers = min(len(idle_files), os.cpu_count() or 1)
+    if workers > 1:
+        chunksize = max(1, len(idle_files) // (4 * workers))
+        with ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("fork")) as pool:
+            results = list(pool.map(scan, idle_files, chunksize=chunksize))
+    else:
+        results = list(map(scan, idle_files))
 
-        if result.success:
-            file_size = os.path.getsize(file_path)
+    for file_path, result in zip(idle_files, results, strict=True):
+        if result is not None and result.success:
+            file_size = sizes[file_path]
             preview["files"].append(
                 {
                     "path": file_path,
@@ -944,13 +1232,19 @@ class FilterDaemon:
         kismet_files = find_kismetdb_files(self.watch_dir)
 
         for file_path in kismet_files:
+            # One stat per file and tick serves both checks below
+            try:
+                st = os.stat(file_path)
+            except OSError:
+                continue  # Removed since the scan
+
             # Skip files currently being written
-            if is_file_in_use(file_path):
+            if is_file_in_use(file_path, st):
                 continue
 
             # Skip already processed files (unless modified)
-            mtime = os.path.getmtime(file_path)
-            if file_path in self.file_mtimes and self.file_mtimes[file_path] == mtime:
+            mtime = st.st_mtime
+            if self.file_mtimes.get(file_path) == mtime:
                 continue
 
             # Process the file
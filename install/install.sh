@@ -92,6 +92,7 @@ readonly CHANNELS_24_ALL="1,2,3,4,5,6,7,8,9,10,11"
 readonly CHANNELS_24_NONOVERLAP="1,6,11"
 readonly CHANNELS_5_ALL="36,40,44,48,52,56,60,64,100,104,108,112,116,120,124,128,132,136,140,144,149,153,157,161,165"
 readonly CHANNELS_6_PSC="5,21,37,53,69,85,101,117,133,149,165,181,197,213,229"
+readonly CHANNELS_6_ALL="1,5,9,13,17,21,25,29,33,37,41,45,49,53,57,61,65,69,73,77,81,85,89,93,97,101,105,109,113,117,121,125,129,133,137,141,145,149,153,157,161,165,169,173,177,181,185,189,193,197,201,205,209,213,217,221,225,229,233"
 
 # Script mode
 MODE="install"
@@ -512,8 +513,8 @@ select_channels_for_band() {
                 echo "${values[0]}"
             fi
         elif [[ "$selected" == "all_6ghz" ]]; then
-            # Full 6GHz channel list (all PSC + additional)
-            echo "$CHANNELS_6_PSC"
+            # Full 6GHz channel list (all 59 20MHz channels, PSC included)
+            echo "$CHANNELS_6_ALL"
         else
             echo "$selected"
         fi
@@ -4,26 +4,36 @@ WarPie WiFi Adapter Configuration
 Interactive configuration using InquirerPy for beautiful prompts.
 """
 
+from __future__ import annotations
+
+import contextlib
+import errno
+import functools
+import hashlib
+import json
+import os
+import re
+import socket
+import struct
 import subprocess
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from importlib.util import find_spec
+from operator import attrgetter
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
 
-# Check for dependencies
-try:
-    from InquirerPy import inquirer
-    from rich.console import Console
-    from rich.panel import Panel
-    from rich.table import Table
-except ImportError:
-    print("Installing required packages...")
-    subprocess.check_call([sys.executable, "-m", "pip", "install", "inquirerpy", "rich", "-q"])
-    from InquirerPy import inquirer
     from rich.console import Console
-    from rich.panel import Panel
-    from rich.table import Table
 
-console = Console()
+# Section banner rule used by _section_header
+_SECTION_RULE = (
+    "[bold cyan]═══════════════════════════════════════════════════════════════[/bold cyan]"
+)
 
 # Custom InquirerPy indicators for square bracket style
 INDICATOR_CHECKED = "■"  # Filled block
@@ -37,6 +47,45 @@ CHANNELS_5_ALL = (
     "36,40,44,48,52,56,60,64,100,104,108,112,116,120,124,128,132,136,140,144,149,153,157,161,165"
 )
 CHANNELS_6_PSC = "5,21,37,53,69,85,101,117,133,149,165,181,197,213,229"
+CHANNELS_6_ALL = (
+    "1,5,9,13,17,21,25,29,33,37,41,45,49,53,57,61,65,69,73,77,81,85,"
+    "89,93,97,101,105,109,113,117,121,125,129,133,137,141,145,149,153,157,161,165,169,173,"
+    "177,181,185,189,193,197,201,205,209,213,217,221,225,229,233"
+)
+
+# Channel presets offered by select_channels, built once at import
+_CHOICE_CUSTOM = {"name": f"[{INDICATOR_UNCHECKED}] Custom list", "value": "custom"}
+_CHOICES_24 = (
+    {"name": f"[{INDICATOR_UNCHECKED}] All channels (1-11)", "value": CHANNELS_24_ALL},
+    {
+        "name": f"[{INDICATOR_UNCHECKED}] Non-overlapping (1,6,11) - recommended",
+        "value": CHANNELS_24_NONOVERLAP,
+    },
+    _CHOICE_CUSTOM,
+)
+_CHOICES_5 = (
+    {"name": f"[{INDICATOR_UNCHECKED}] All channels (36-165)", "value": CHANNELS_5_ALL},
+    _CHOICE_CUSTOM,
+)
+_CHOICES_6 = (
+    {
+        "name": f"[{INDICATOR_UNCHECKED}] PSC channels (15 channels) - recommended",
+        "value": CHANNELS_6_PSC,
+    },
+    {"name": f"[{INDICATOR_UNCHECKED}] All channels (59 channels)", "value": CHANNELS_6_ALL},
+    _CHOICE_CUSTOM,
+)
+CHANNEL_CHOICES = {"2.4GHz": _CHOICES_24, "5GHz": _CHOICES_5, "6GHz": _CHOICES_6}
+
+# Network interfaces in sysfs
+SYSFS_NET = "/sys/class/net"
+
+# MAC recorded when an interface's address cannot be read
+UNKNOWN_MAC = "00:00:00:00:00:00"
+
+# Detected bands per interface, reused across runs while the same adapters
+# are present (/run is tmpfs, so the cache never outlives a reboot)
+ADAPTER_CACHE = "/run/warpie/adapters.cache.json"
 
 # Known WiFi chipsets
 WIFI_CHIPSETS = {
@@ -48,31 +97,149 @@ WIFI_CHIPSETS = {
     "88XXau": ("Realtek RTL8812AU/21AU", "e.g., ALFA AWUS036ACH"),
 }
 
+# Drivers whose every supported chip is single-band, so detection can skip the
+# phy query. rt2800usb and ath9k_htc are not listed: both also drive dual-band
+# chips (RT3572/RT5572, AR7010+AR9280).
+SINGLE_BAND_DRIVERS = {
+    "rtl8xxxu": ("2.4GHz",),
+}
+
+# nl80211 generic netlink constants (linux/netlink.h, genetlink.h, nl80211.h)
+_NETLINK_GENERIC = 16
+_NL_RECV_SIZE = 65536
+# Seconds to wait for each netlink reply; a dump that stalls then raises
+# socket.timeout (an OSError) and detection falls back to iw
+_NL_TIMEOUT = 2.0
+_NLM_F_REQUEST = 0x1
+_NLM_F_DUMP = 0x300
+_NLMSG_ERROR = 2
+_NLMSG_DONE = 3
+_NLA_TYPE_MASK = 0x3FFF
+_GENL_ID_CTRL = 0x10
+_CTRL_CMD_GETFAMILY = 3
+_CTRL_ATTR_FAMILY_ID = 1
+_CTRL_ATTR_FAMILY_NAME = 2
+_NL80211_CMD_GET_WIPHY = 1
+_NL80211_ATTR_WIPHY = 1
+_NL80211_ATTR_WIPHY_BANDS = 22
+_NL80211_ATTR_SPLIT_WIPHY_DUMP = 174
+
+# nl80211 band index -> band label (iw prints index + 1 as "Band N:")
+_NL80211_BANDS = {0: "2.4GHz", 1: "5GHz", 3: "6GHz"}
+
+# iw phy info band headers ("\tBand N:" lines), matched in one pass over the
+# raw (bytes) output, and the band each header number stands for
+_IW_BAND_RE = re.compile(rb"^\tBand (\d+):", re.MULTILINE)
+_IW_BANDS = {b"1": "2.4GHz", b"2": "5GHz", b"4": "6GHz"}
+
+# First iw phy info line printed after all band sections
+_IW_END_OF_BANDS = b"\tSupported commands:"
+
+# Device ID prefix in kismet_cap_ti_cc_2540 --list output
+_BTLE_DEVICE_PREFIX = "ticc2540-"
+
+# Band checkbox labels with a helpful description for each band
+BAND_DESCRIPTIONS = {
+    "2.4GHz": "2.4GHz (Better range, more interference)",
+    "5GHz": "5GHz (Faster, less interference, shorter range)",
+    "6GHz": "6GHz (WiFi 6E, newest, requires compatible hardware)",
+}
+
+# Adapter name suffix for each enabled band combination
+ADAPTER_NAME_SUFFIXES = {
+    frozenset({"2.4GHz"}): "24GHz",
+    frozenset({"5GHz"}): "5GHz",
+    frozenset({"6GHz"}): "6GHz",
+    frozenset({"2.4GHz", "5GHz"}): "DualBand",
+    frozenset({"5GHz", "6GHz"}): "HighBand",
+    frozenset({"2.4GHz", "6GHz"}): "Mixed",
+    frozenset({"2.4GHz", "5GHz", "6GHz"}): "TriBand",
+}
+
+# adapters.conf layout: one header, then one block per capture adapter
+CONFIG_HEADER_TEMPLATE = """\
+# WarPie Adapter Configuration
+# Generated by warpie_config.py
+
+WIFI_AP="{ap_iface}"
+WIFI_AP_MAC="{ap_mac}"
+
+# Home WiFi Configuration
+HOME_WIFI_ENABLED="{home_enabled}"
+HOME_WIFI_SSID="{home_ssid}"
+HOME_WIFI_PSK="{home_psk}"
 
-@dataclass
+# BTLE Configuration (TI CC2540)
+BTLE_ENABLED="{btle_enabled}"
+BTLE_DEVICE="{btle_device}"
+
+# Kismet Configuration
+KISMET_AUTOSTART="{kismet_autostart}"
+KISMET_STARTUP_MODE="{kismet_startup_mode}"
+
+WIFI_CAPTURE_COUNT={count}
+"""
+
+CONFIG_ADAPTER_TEMPLATE = """
+ADAPTER_{i}_IFACE="{cfg.interface}"
+ADAPTER_{i}_MAC="{mac}"
+ADAPTER_{i}_NAME="{cfg.name}"
+ADAPTER_{i}_BANDS="{bands}"
+ADAPTER_{i}_CHANNELS_24="{cfg.channels_24}"
+ADAPTER_{i}_CHANNELS_5="{cfg.channels_5}"
+ADAPTER_{i}_CHANNELS_6="{cfg.channels_6}"
+"""
+
+
+# InquirerPy and rich are imported lazily by the functions that render UI,
+# so detection-only code paths (and failed detection) skip their import cost.
+def _ensure_dependencies() -> None:
+    """Exit with install instructions if InquirerPy or rich is missing.
+
+    install.sh installs both before running this script. find_spec checks
+    for them without importing either package.
+    """
+    missing = [name for name in ("InquirerPy", "rich") if find_spec(name) is None]
+    if missing:
+        sys.exit(
+            f"Missing required packages: {', '.join(missing)}\n"
+            "Install them with: pip3 install inquirerpy rich"
+        )
+
+
+@functools.cache
+def _console() -> Console:
+    """Return the shared rich Console, creating it on first use."""
+    from rich.console import Console
+
+    return Console()
+
+
+@dataclass(slots=True, frozen=True)
 class WifiAdapter:
     """Represents a detected WiFi adapter."""
 
     interface: str
-    mac: str
+    mac: str  # As reported by sysfs (lowercase); uppercased for display/config
     driver: str
     bands: list[str] = field(default_factory=list)
-
-    @property
-    def driver_name(self) -> str:
-        """Get human-readable driver name."""
-        if self.driver in WIFI_CHIPSETS:
-            name, desc = WIFI_CHIPSETS[self.driver]
-            return f"{name} ({desc})"
-        return self.driver
-
-    @property
-    def bands_str(self) -> str:
-        """Get bands as space-separated string."""
-        return " ".join(self.bands)
-
-
-@dataclass
+    # Display strings, derived once at construction (see __post_init__)
+    driver_name: str = field(init=False, repr=False, compare=False)
+    bands_str: str = field(init=False, repr=False, compare=False)
+    label: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Precompute the driver name, bands string and menu label."""
+        chipset = WIFI_CHIPSETS.get(self.driver)
+        driver_name = f"{chipset[0]} ({chipset[1]})" if chipset else self.driver
+        bands_str = " ".join(self.bands)
+        # Frozen dataclass: assign the derived fields via object.__setattr__
+        object.__setattr__(self, "driver_name", driver_name)
+        object.__setattr__(self, "bands_str", bands_str)
+        object.__setattr__(self, "label", f"{self.interface} - {driver_name} [{bands_str}]")
+
+
+@dataclass(slots=True, frozen=True)
 class AdapterConfig:
     """Configuration for a single adapter."""
 
@@ -85,7 +252,7 @@ class AdapterConfig:
     channels_6: str = ""
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BTLEAdapter:
     """Represents a detected BTLE adapter (TI CC2540)."""
 
@@ -99,118 +266,381 @@ def detect_btle_adapters() -> list[BTLEAdapter]:
     Returns a list of detected BTLE adapters. Empty list if none found
     or if kismet_cap_ti_cc_2540 is not installed.
     """
-    adapters = []
-
     try:
         result = subprocess.run(
             ["kismet_cap_ti_cc_2540", "--list"],
             capture_output=True,
-            text=True,
             check=False,
         )
+    except (OSError, subprocess.SubprocessError):
+        # kismet_cap_ti_cc_2540 not installed or failed to run
+        return []
 
-        # Parse output - kismet outputs to stderr, format: "ticc2540-1-5 (ticc2540)"
-        output = result.stderr if result.stderr else result.stdout
-        for raw_line in output.splitlines():
-            stripped_line = raw_line.strip()
-            # Look for lines like "ticc2540-1-5 (ticc2540)"
-            if stripped_line.startswith("ticc2540-") and "(ticc2540)" in stripped_line:
-                device_id = stripped_line.split()[0]  # e.g., "ticc2540-1-5"
-                # Extract USB path from device_id (e.g., "1-5" from "ticc2540-1-5")
-                usb_path = device_id.replace("ticc2540-", "")
-                adapters.append(BTLEAdapter(device_id=device_id, usb_path=usb_path))
-
-    except FileNotFoundError:
-        # kismet_cap_ti_cc_2540 not installed
-        pass
-    except Exception:  # noqa: S110
-        # Other errors - silently ignore during detection
-        pass
+    # Parse output - kismet outputs to stderr, format: "ticc2540-1-5 (ticc2540)"
+    # Captured as bytes and decoded once, rather than through a text wrapper
+    adapters = []
+    output = (result.stderr or result.stdout).decode("utf-8", "replace")
+    for raw_line in output.splitlines():
+        device_id, _, rest = raw_line.lstrip().partition(" ")
+        if device_id.startswith(_BTLE_DEVICE_PREFIX) and "(ticc2540)" in rest:
+            # Extract USB path from device_id (e.g., "1-5" from "ticc2540-1-5")
+            usb_path = device_id[len(_BTLE_DEVICE_PREFIX) :]
+            adapters.append(BTLEAdapter(device_id=device_id, usb_path=usb_path))
 
     return adapters
 
 
-def detect_wifi_interfaces() -> list[WifiAdapter]:
-    """Detect all WiFi interfaces and their capabilities."""
-    adapters = []
+def _read_sysfs(path: str) -> str:
+    """Read a small sysfs attribute with a single open/read/close."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.read(fd, 4096).decode("ascii", "replace").strip()
+    finally:
+        os.close(fd)
+
 
-    # Find all wireless interfaces
-    net_path = Path("/sys/class/net")
-    for iface_path in net_path.iterdir():
-        # Check if it's a wireless interface
-        wireless_path = iface_path / "wireless"
-        phy_path = iface_path / "phy80211"
+def _list_wireless_interfaces() -> tuple[list[tuple[str, str]], str]:
+    """Find wireless interfaces in a single pass over /sys/class/net.
 
-        if not (wireless_path.exists() or phy_path.exists()):
-            continue
+    Returns (name, sysfs path) for each wireless interface, sorted by name,
+    plus a fingerprint of the set for the adapter cache: the names and the
+    newest phy80211 mtime, so plugging, unplugging or swapping an adapter
+    yields a different key.
+    """
+    interfaces = []
+    newest = 0
+
+    # Interfaces are symlinks in /sys/class/net; scandir reports the entry
+    # type for free, so plain files such as bonding_masters are skipped
+    # without a stat.
+    with os.scandir(SYSFS_NET) as entries:
+        for entry in entries:
+            if not entry.is_symlink():
+                continue
+            # Check if it's a wireless interface. Every cfg80211 device links its
+            # phy80211, so one stat both filters and supplies the cache mtime
+            try:
+                mtime = os.stat(entry.path + "/phy80211").st_mtime_ns
+            except OSError:
+                continue
+            interfaces.append((entry.name, entry.path))
+            newest = max(newest, mtime)
 
-        iface = iface_path.name
+    interfaces.sort()
+    key = f"{','.join(name for name, _ in interfaces)}@{newest}"
+    return interfaces, key
 
+
+def _read_interfaces(
+    interfaces: list[tuple[str, str]],
+) -> list[tuple[str, str, str, int | None]]:
+    """Read MAC, driver and wiphy index for each (name, sysfs path) pair.
+
+    Only I/O errors are handled per interface; KeyboardInterrupt is left to
+    propagate so Ctrl-C aborts detection immediately.
+    """
+    found = []
+    for iface, path in interfaces:
         # Get MAC address
         try:
-            mac = (iface_path / "address").read_text().strip().upper()
+            mac = _read_sysfs(path + "/address")
         except OSError:
-            mac = "00:00:00:00:00:00"
+            mac = UNKNOWN_MAC
+
+        # Get driver - only the link target's basename is needed, so a single
+        # readlink() is enough (resolve() would stat every path component)
+        try:
+            driver = os.path.basename(os.readlink(path + "/device/driver"))
+        except OSError:
+            driver = "unknown"
+
+        # Get wiphy index, the key for the phy's bands in the nl80211 dump
+        try:
+            phy_index = int(_read_sysfs(path + "/phy80211/index"))
+        except (OSError, ValueError):
+            phy_index = None
+
+        found.append((iface, mac, driver, phy_index))
+
+    return found
+
+
+def _load_adapter_cache(key: str) -> dict[str, list[str]] | None:
+    """Return the cached bands per interface for key, or None on a miss."""
+    try:
+        cache = json.loads(Path(ADAPTER_CACHE).read_text())
+        if cache["key"] != key:
+            return None
+        bands = cache["bands"]
+        if not all(isinstance(iface_bands, list) for iface_bands in bands.values()):
+            return None
+        return bands
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None
 
-        # Get driver
-        driver = "unknown"
-        driver_path = iface_path / "device" / "driver"
-        if driver_path.exists():
-            try:
-                driver = driver_path.resolve().name
-            except OSError:
-                driver = "unknown"
 
-        # Detect bands from phy capabilities
-        bands = detect_bands(iface)
+def _save_adapter_cache(key: str, adapters: list[WifiAdapter]) -> None:
+    """Store detected bands; failures (e.g. not running as root) are ignored."""
+    cache = {"key": key, "bands": {a.interface: a.bands for a in adapters}}
+    cache_path = Path(ADAPTER_CACHE)
+    with contextlib.suppress(OSError):
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(json.dumps(cache))
 
+
+def detect_wifi_interfaces() -> list[WifiAdapter]:
+    """Detect all WiFi interfaces and their capabilities.
+
+    Bands are cached under /run/warpie, so re-running the configurator with
+    the same adapters plugged in skips the phy queries. MAC and driver are
+    always re-read, since they can change (macchanger, MAC randomisation)
+    without a re-plug and the MAC is what udev pins interface names to.
+    """
+    interfaces, key = _list_wireless_interfaces()
+    if not interfaces:
+        return []
+
+    found = _read_interfaces(interfaces)
+    cached = _load_adapter_cache(key)
+    if cached is not None and all(iface in cached for iface, _, _, _ in found):
+        return [
+            WifiAdapter(interface=iface, mac=mac, driver=driver, bands=cached[iface])
+            for iface, mac, driver, _ in found
+        ]
+
+    adapters = _detect_adapters(found)
+    if adapters:
+        _save_adapter_cache(key, adapters)
+    return adapters
+
+
+def _detect_adapters(found: list[tuple[str, str, str, int | None]]) -> list[WifiAdapter]:
+    """Build adapters from _read_interfaces() results without consulting the cache."""
+    # Detect bands for every phy with a single nl80211 dump, unless every
+    # adapter's driver already implies its band
+    phy_bands = {}
+    if any(driver not in SINGLE_BAND_DRIVERS for _, _, driver, _ in found):
+        with contextlib.suppress(OSError):
+            phy_bands = _dump_phy_bands()
+
+    # Adapters missing from the dump fall back to iw. A single "iw phy" run
+    # covers every phy at once; only phys it doesn't list go through
+    # detect_bands, concurrently, since each run is a fork+exec.
+    missing = [
+        iface
+        for iface, _, driver, phy_index in found
+        if driver not in SINGLE_BAND_DRIVERS and phy_index not in phy_bands
+    ]
+    fallback_bands = {}
+    if missing:
+        iw_bands = _scan_all_bands()
+        for iface in missing:
+            with contextlib.suppress(OSError):
+                phy = _read_sysfs(f"{SYSFS_NET}/{iface}/phy80211/name")
+                if phy in iw_bands:
+                    fallback_bands[iface] = iw_bands[phy] or ["2.4GHz"]
+        missing = [iface for iface in missing if iface not in fallback_bands]
+    if missing:
+        with ThreadPoolExecutor(max_workers=min(8, len(missing))) as executor:
+            fallback_bands.update(zip(missing, executor.map(detect_bands, missing), strict=True))
+
+    adapters = []
+    for iface, mac, driver, phy_index in found:
+        if driver in SINGLE_BAND_DRIVERS:
+            bands = list(SINGLE_BAND_DRIVERS[driver])
+        elif phy_index in phy_bands:
+            bands = phy_bands[phy_index] or ["2.4GHz"]
+        else:
+            bands = fallback_bands[iface]
         adapters.append(WifiAdapter(interface=iface, mac=mac, driver=driver, bands=bands))
 
-    return sorted(adapters, key=lambda a: a.interface)
+    return sorted(adapters, key=attrgetter("interface"))
 
 
 def detect_bands(interface: str) -> list[str]:
-    """Detect supported bands for an interface using iw.
+    """Detect supported bands for an interface.
 
-    Uses the reliable method of checking for Band headers in iw phy output.
+    Asks the kernel directly over nl80211 netlink, falling back to the Band
+    headers in iw phy output if netlink is unavailable.
     Band 1 = 2.4GHz, Band 2 = 5GHz, Band 4 = 6GHz (WiFi 6E)
     """
-    bands = []
+    phy_path = f"{SYSFS_NET}/{interface}/phy80211"
 
     try:
-        # Get phy name
-        phy_path = Path(f"/sys/class/net/{interface}/phy80211/name")
-        if phy_path.exists():
-            phy = phy_path.read_text().strip()
-        else:
-            return ["2.4GHz"]  # Default assumption
+        phy_index = int(_read_sysfs(phy_path + "/index"))
+        bands = _dump_phy_bands(phy_index).get(phy_index, [])
+    except (OSError, ValueError):
+        # Also covers interfaces without a phy80211 link; _iw_phy_bands then
+        # fails to read the phy name and returns the 2.4GHz default
+        bands = _iw_phy_bands(phy_path)
+
+    return bands if bands else ["2.4GHz"]
+
 
-        # Query iw for band info
+def _iw_phy_bands(phy_path: str) -> list[str]:
+    """Detect bands for a phy by running iw (fallback for detect_bands)."""
+    found = set()
+    try:
+        phy = _read_sysfs(phy_path + "/name")
+
+        # Query iw for band info. The full output runs to hundreds of KB (every
+        # rate and capability), so stream it line by line as raw bytes and stop
+        # once every band is found or the band sections are over.
+        with subprocess.Popen(
+            ["iw", "phy", phy, "info"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        ) as proc:
+            for line in proc.stdout:
+                # Check for band headers (most reliable method)
+                # This matches the proven bash implementation in install.sh
+                match = _IW_BAND_RE.match(line)
+                if match:
+                    found.add(match.group(1))
+                    if found >= _IW_BANDS.keys():
+                        break
+                elif line.startswith(_IW_END_OF_BANDS):
+                    break
+            proc.terminate()
+    except (OSError, subprocess.SubprocessError):
+        return ["2.4GHz"]  # Safe default
+
+    return [band for number, band in _IW_BANDS.items() if number in found]
+
+
+def _parse_iw_bands(output: bytes) -> list[str]:
+    """Return the bands whose headers appear in iw phy output."""
+    found = set(_IW_BAND_RE.findall(output))
+    return [band for number, band in _IW_BANDS.items() if number in found]
+
+
+def _scan_all_bands() -> dict[str, list[str]]:
+    """Map every phy name to its bands from a single iw phy run."""
+    try:
         result = subprocess.run(
-            ["iw", "phy", phy, "info"], check=False, capture_output=True, text=True
+            ["iw", "phy"],
+            check=False,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
         )
+    except (OSError, subprocess.SubprocessError):
+        return {}
 
-        output = result.stdout
+    # Each phy's section starts with a "Wiphy <name>" line
+    phy_bands = {}
+    for section in (b"\n" + result.stdout).split(b"\nWiphy ")[1:]:
+        name, _, body = section.partition(b"\n")
+        phy_bands[name.strip().decode()] = _parse_iw_bands(body)
+    return phy_bands
 
-        # Check for band headers (most reliable method)
-        # This matches the proven bash implementation in install.sh
-        if "Band 1:" in output:
-            bands.append("2.4GHz")
 
-        if "Band 2:" in output:
-            bands.append("5GHz")
+def _nla(attr_type: int, payload: bytes = b"") -> bytes:
+    """Encode one netlink attribute, padded to 4-byte alignment."""
+    length = 4 + len(payload)
+    return struct.pack("=HH", length, attr_type) + payload + bytes(-length % 4)
 
-        if "Band 4:" in output:
-            bands.append("6GHz")
 
-    except Exception:
-        bands = ["2.4GHz"]  # Safe default
+def _nla_parse(data: bytes) -> Iterator[tuple[int, bytes]]:
+    """Yield (type, payload) for each netlink attribute in data."""
+    offset = 0
+    while offset + 4 <= len(data):
+        length, attr_type = struct.unpack_from("=HH", data, offset)
+        if length < 4:
+            break
+        yield attr_type & _NLA_TYPE_MASK, data[offset + 4 : offset + length]
+        offset += (length + 3) & ~3
 
-    return bands if bands else ["2.4GHz"]
+
+def _genl_request(
+    sock: socket.socket, family: int, cmd: int, attrs: bytes, flags: int = 0
+) -> list[bytes]:
+    """Send a generic netlink request and return the attributes of each reply.
+
+    Raises OSError if the kernel answers with an error.
+    """
+    payload = struct.pack("=BBH", cmd, 1, 0) + attrs  # genlmsghdr: cmd, version
+    header = struct.pack("=IHHII", 16 + len(payload), family, _NLM_F_REQUEST | flags, 1, 0)
+    sock.send(header + payload)
+
+    replies = []
+    while True:
+        data = sock.recv(_NL_RECV_SIZE)
+        offset = 0
+        while offset + 16 <= len(data):
+            length, msg_type = struct.unpack_from("=IH", data, offset)
+            if msg_type == _NLMSG_ERROR:
+                (error,) = struct.unpack_from("=i", data, offset + 16)
+                if error:
+                    raise OSError(-error, os.strerror(-error))
+                return replies
+            if msg_type == _NLMSG_DONE or length < 16:
+                return replies
+            # Skip nlmsghdr (16 bytes) and genlmsghdr (4 bytes)
+            replies.append(data[offset + 20 : offset + length])
+            offset += (length + 3) & ~3
+        if not flags & _NLM_F_DUMP:
+            return replies
+
+
+def _nl80211_family(sock: socket.socket) -> int:
+    """Resolve the generic netlink family id of nl80211."""
+    replies = _genl_request(
+        sock, _GENL_ID_CTRL, _CTRL_CMD_GETFAMILY, _nla(_CTRL_ATTR_FAMILY_NAME, b"nl80211\0")
+    )
+    for reply in replies:
+        for attr_type, payload in _nla_parse(reply):
+            if attr_type == _CTRL_ATTR_FAMILY_ID:
+                return struct.unpack_from("=H", payload)[0]
+    raise OSError(errno.ENOENT, "nl80211 netlink family not found")
+
+
+def _dump_phy_bands(phy_index: int | None = None) -> dict[int, list[str]]:
+    """Map wiphy index -> supported bands using one nl80211 wiphy dump.
+
+    Issues the same split dump as `iw phy info` (optionally filtered to one
+    phy) without spawning a process, so every adapter's bands come back in a
+    single request. Raises OSError if nl80211 is unavailable.
+    """
+    attrs = _nla(_NL80211_ATTR_SPLIT_WIPHY_DUMP)
+    if phy_index is not None:
+        attrs += _nla(_NL80211_ATTR_WIPHY, struct.pack("=I", phy_index))
+
+    with socket.socket(socket.AF_NETLINK, socket.SOCK_RAW, _NETLINK_GENERIC) as sock:
+        sock.settimeout(_NL_TIMEOUT)
+        replies = _genl_request(
+            sock, _nl80211_family(sock), _NL80211_CMD_GET_WIPHY, attrs, _NLM_F_DUMP
+        )
+
+    # A split dump spreads each phy over several messages, all tagged with
+    # its wiphy index; nested band attribute types are nl80211 band indexes
+    found: dict[int, set[int]] = {}
+    for reply in replies:
+        wiphy = None
+        band_ids = set()
+        for attr_type, payload in _nla_parse(reply):
+            if attr_type == _NL80211_ATTR_WIPHY:
+                wiphy = struct.unpack_from("=I", payload)[0]
+            elif attr_type == _NL80211_ATTR_WIPHY_BANDS:
+                band_ids.update(band for band, _ in _nla_parse(payload))
+        if wiphy is not None:
+            found.setdefault(wiphy, set()).update(band_ids)
+
+    return {
+        wiphy: [label for band, label in _NL80211_BANDS.items() if band in band_ids]
+        for wiphy, band_ids in found.items()
+    }
+
+
+def _section_header(title: str) -> str:
+    """Markup for a cyan section banner, printed as a single block."""
+    return f"\n{_SECTION_RULE}\n[bold cyan]  {title}[/bold cyan]\n{_SECTION_RULE}"
 
 
 def display_adapters(adapters: list[WifiAdapter]) -> None:
     """Display detected adapters in a table."""
+    from rich.table import Table
+
+    console = _console()
     table = Table(title="Detected WiFi Interfaces")
     table.add_column("#", style="cyan", justify="right")
     table.add_column("Interface", style="green")
@@ -220,7 +650,7 @@ def display_adapters(adapters: list[WifiAdapter]) -> None:
 
     for i, adapter in enumerate(adapters, 1):
         table.add_row(
-            str(i), adapter.interface, adapter.mac, adapter.bands_str, adapter.driver_name
+            str(i), adapter.interface, adapter.mac.upper(), adapter.bands_str, adapter.driver_name
         )
 
     console.print(table)
@@ -228,6 +658,10 @@ def display_adapters(adapters: list[WifiAdapter]) -> None:
 
 def select_ap_interface(adapters: list[WifiAdapter]) -> WifiAdapter:
     """Select the Access Point interface."""
+    from InquirerPy import inquirer
+    from rich.panel import Panel
+
+    console = _console()
     console.print()
     console.print(
         Panel.fit(
@@ -241,13 +675,7 @@ def select_ap_interface(adapters: list[WifiAdapter]) -> WifiAdapter:
         )
     )
 
-    choices = [
-        {
-            "name": f"[{INDICATOR_UNCHECKED}] {a.interface} - {a.driver_name} [{a.bands_str}]",
-            "value": a,
-        }
-        for a in adapters
-    ]
+    choices = [{"name": f"[{INDICATOR_UNCHECKED}] {a.label}", "value": a} for a in adapters]
 
     return inquirer.select(
         message="Select AP interface:",
@@ -263,6 +691,10 @@ def select_capture_interfaces(
     adapters: list[WifiAdapter], exclude: WifiAdapter
 ) -> list[WifiAdapter]:
     """Select capture interfaces (multi-select with checkboxes)."""
+    from InquirerPy import inquirer
+    from rich.panel import Panel
+
+    console = _console()
     console.print()
     console.print(
         Panel.fit(
@@ -277,16 +709,12 @@ def select_capture_interfaces(
         )
     )
 
-    available = [a for a in adapters if a.interface != exclude.interface]
+    choices = [{"name": a.label, "value": a} for a in adapters if a is not exclude]
 
-    if not available:
+    if not choices:
         console.print("[red]No interfaces available for capture![/red]")
         sys.exit(1)
 
-    choices = [
-        {"name": f"{a.interface} - {a.driver_name} [{a.bands_str}]", "value": a} for a in available
-    ]
-
     selected = inquirer.checkbox(
         message="Select capture interface(s):",
         choices=choices,
@@ -312,26 +740,23 @@ def select_capture_interfaces(
 
 def select_bands(adapter: WifiAdapter) -> list[str]:
     """Select which bands to capture for an adapter."""
-    if len(adapter.bands) == 1:
+    from InquirerPy import inquirer
+
+    console = _console()
+    bands = adapter.bands
+    if len(bands) == 1:
         # Only one band available, auto-select but inform user
         console.print(
-            f"[bright_yellow]   ⚡ Only {adapter.bands[0]} available, auto-selected[/bright_yellow]"
+            f"[bright_yellow]   ⚡ Only {bands[0]} available, auto-selected[/bright_yellow]"
         )
-        return adapter.bands.copy()
+        return bands.copy()
 
-    # Add helpful descriptions for each band
-    band_descriptions = {
-        "2.4GHz": "2.4GHz (Better range, more interference)",
-        "5GHz": "5GHz (Faster, less interference, shorter range)",
-        "6GHz": "6GHz (WiFi 6E, newest, requires compatible hardware)",
-    }
-
-    choices = [{"name": band_descriptions.get(band, band), "value": band} for band in adapter.bands]
+    choices = [{"name": BAND_DESCRIPTIONS.get(band, band), "value": band} for band in bands]
 
     return inquirer.checkbox(
         message=f"Select bands for {adapter.interface}:",
         choices=choices,
-        default=adapter.bands,  # All selected by default
+        default=bands,  # All selected by default
         validate=lambda result: len(result) > 0,
         invalid_message="Select at least one band",
         instruction="Space Toggle | Enter Confirm | All selected by default",
@@ -345,33 +770,11 @@ def select_bands(adapter: WifiAdapter) -> list[str]:
 
 def select_channels(band: str) -> str:
     """Select channel configuration for a band."""
-    if band == "2.4GHz":
-        choices = [
-            {"name": f"[{INDICATOR_UNCHECKED}] All channels (1-11)", "value": CHANNELS_24_ALL},
-            {
-                "name": f"[{INDICATOR_UNCHECKED}] Non-overlapping (1,6,11) - recommended",
-                "value": CHANNELS_24_NONOVERLAP,
-            },
-            {"name": f"[{INDICATOR_UNCHECKED}] Custom list", "value": "custom"},
-        ]
-    elif band == "5GHz":
-        choices = [
-            {"name": f"[{INDICATOR_UNCHECKED}] All channels (36-165)", "value": CHANNELS_5_ALL},
-            {"name": f"[{INDICATOR_UNCHECKED}] Custom list", "value": "custom"},
-        ]
-    else:  # 6GHz
-        choices = [
-            {
-                "name": f"[{INDICATOR_UNCHECKED}] PSC channels (15 channels) - recommended",
-                "value": CHANNELS_6_PSC,
-            },
-            {"name": f"[{INDICATOR_UNCHECKED}] All channels", "value": CHANNELS_6_PSC},
-            {"name": f"[{INDICATOR_UNCHECKED}] Custom list", "value": "custom"},
-        ]
+    from InquirerPy import inquirer
 
     result = inquirer.select(
         message=f"{band} channel selection:",
-        choices=choices,
+        choices=CHANNEL_CHOICES[band],
         pointer=INDICATOR_POINTER,
         qmark="",
         amark="",
@@ -390,30 +793,18 @@ def select_channels(band: str) -> str:
 
 def generate_adapter_name(index: int, bands: list[str]) -> str:
     """Generate a descriptive name for the adapter."""
-    count = len(bands)
-
-    # Single band
-    if count == 1:
-        band = bands[0]
-        band_map = {"6GHz": "6GHz", "5GHz": "5GHz"}
-        return f"WiFi_{band_map.get(band, '24GHz')}_{index}"
-
-    # Dual band
-    if count == 2:
-        if "2.4GHz" in bands and "5GHz" in bands:
-            name_suffix = "DualBand"
-        elif "5GHz" in bands and "6GHz" in bands:
-            name_suffix = "HighBand"
-        else:
-            name_suffix = "Mixed"
-        return f"WiFi_{name_suffix}_{index}"
-
-    # Tri-band or more
-    return f"WiFi_TriBand_{index}"
+    suffix = ADAPTER_NAME_SUFFIXES.get(frozenset(bands))
+    if suffix is None:
+        # Unrecognised combination - fall back on the number of bands
+        suffix = {1: "24GHz", 2: "Mixed"}.get(len(bands), "TriBand")
+    return f"WiFi_{suffix}_{index}"
 
 
 def configure_adapter(adapter: WifiAdapter, index: int, total: int) -> AdapterConfig:
     """Configure bands and channels for a single adapter."""
+    from rich.panel import Panel
+
+    console = _console()
     console.print()
     console.print(
         Panel.fit(
@@ -454,21 +845,38 @@ def configure_adapter(adapter: WifiAdapter, index: int, total: int) -> AdapterCo
         channels_6=channels_6,
     )
 
-    # Show confirmation
-    console.print(f"\n[green]✓ {adapter.interface} → {name}[/green]")
-    console.print(f"    Bands: {', '.join(selected_bands)}")
+    # Show confirmation (built up and printed in one call)
+    lines = [
+        f"\n[green]✓ {adapter.interface} → {name}[/green]",
+        f"    Bands: {', '.join(selected_bands)}",
+    ]
     if channels_24:
-        console.print(f"    2.4GHz channels: {channels_24}")
+        lines.append(f"    2.4GHz channels: {channels_24}")
     if channels_5:
-        console.print(f"    5GHz channels: {channels_5}")
+        lines.append(f"    5GHz channels: {channels_5}")
     if channels_6:
-        console.print(f"    6GHz channels: {channels_6}")
+        lines.append(f"    6GHz channels: {channels_6}")
+    console.print("\n".join(lines))
 
     return config
 
 
+def _wpa_psk(ssid: str, passphrase: str) -> str:
+    """Derive the hex WPA PSK for a network, exactly as wpa_passphrase prints it.
+
+    The PSK is PBKDF2-HMAC-SHA1(passphrase, ssid, 4096 rounds, 32 bytes)
+    (IEEE 802.11i), so it is computed in-process rather than by running
+    wpa_passphrase.
+    """
+    return hashlib.pbkdf2_hmac("sha1", passphrase.encode(), ssid.encode(), 4096, 32).hex()
+
+
 def configure_home_wifi() -> dict[str, str] | None:
     """Configure optional home WiFi connectivity."""
+    from InquirerPy import inquirer
+    from rich.panel import Panel
+
+    console = _console()
     console.print()
     console.print(
         Panel.fit(
@@ -504,8 +912,8 @@ def configure_home_wifi() -> dict[str, str] | None:
     # Get password with masking
     password = inquirer.secret(
         message="Home WiFi Password",
-        validate=lambda x: len(x) >= 8,
-        invalid_message="Password must be at least 8 characters",
+        validate=lambda x: 8 <= len(x) <= 63,
+        invalid_message="Password must be 8-63 characters",
         instruction="Enter your WiFi password (hidden)",
         qmark="",
         amark=": ",
@@ -513,30 +921,12 @@ def configure_home_wifi() -> dict[str, str] | None:
 
     # Generate PSK hash for secure storage
     console.print("[blue]   Generating secure PSK hash...[/blue]")
-    try:
-        result = subprocess.run(
-            ["wpa_passphrase", ssid, password],
-            check=True,
-            capture_output=True,
-            text=True,
-        )
-        # Extract PSK hash from wpa_passphrase output
-        for line in result.stdout.splitlines():
-            if line.strip().startswith("psk=") and not line.strip().startswith("#psk="):
-                psk = line.strip().split("=", 1)[1]
-                break
-        else:
-            console.print("[red]Failed to generate PSK hash[/red]")
-            return None
-
-        console.print(f"[green]✓ Home WiFi configured: {ssid}[/green]")
-        console.print("[dim]   Password stored as secure PSK hash[/dim]")
+    psk = _wpa_psk(ssid, password)
 
-        return {"ssid": ssid, "psk": psk}
+    console.print(f"[green]✓ Home WiFi configured: {ssid}[/green]")
+    console.print("[dim]   Password stored as secure PSK hash[/dim]")
 
-    except subprocess.CalledProcessError:
-        console.print("[red]Failed to generate PSK hash (is wpa_passphrase installed?)[/red]")
-        return None
+    return {"ssid": ssid, "psk": psk}
 
 
 def configure_kismet_autostart() -> tuple[bool, str]:
@@ -546,6 +936,10 @@ def configure_kismet_autostart() -> tuple[bool, str]:
         Tuple of (autostart: bool, startup_mode: str)
         startup_mode is one of: "wardrive", "normal", "targeted"
     """
+    from InquirerPy import inquirer
+    from rich.panel import Panel
+
+    console = _console()
     console.print()
     console.print(
         Panel.fit(
@@ -630,6 +1024,10 @@ def configure_btle(btle_adapters: list[BTLEAdapter]) -> dict[str, str] | None:
 
     Returns dict with 'enabled' and 'device' keys, or None if no adapters.
     """
+    from InquirerPy import inquirer
+    from rich.panel import Panel
+
+    console = _console()
     if not btle_adapters:
         return None
 
@@ -690,111 +1088,85 @@ def save_config(
     kismet_startup_mode: str = "wardrive",
     btle_config: dict[str, str] | None = None,
     output_path: str = "/etc/warpie/adapters.conf",
+    *,
+    fsync: bool = False,
 ) -> None:
     """Save configuration to file.
 
     Uses the detected interface names directly. udev rules will pin these names
     to their MAC addresses for stability across reboots.
-    """
-    lines = [
-        "# WarPie Adapter Configuration",
-        "# Generated by warpie_config.py",
-        "",
-        f'WIFI_AP="{ap.interface}"',
-        f'WIFI_AP_MAC="{ap.mac}"',
-    ]
-
-    # Add home WiFi configuration
-    if home_wifi:
-        lines.extend(
-            [
-                "",
-                "# Home WiFi Configuration",
-                'HOME_WIFI_ENABLED="true"',
-                f'HOME_WIFI_SSID="{home_wifi["ssid"]}"',
-                f'HOME_WIFI_PSK="{home_wifi["psk"]}"',
-            ]
-        )
-    else:
-        lines.extend(
-            [
-                "",
-                "# Home WiFi Configuration",
-                'HOME_WIFI_ENABLED="false"',
-                'HOME_WIFI_SSID=""',
-                'HOME_WIFI_PSK=""',
-            ]
-        )
-
-    # Add BTLE configuration
-    if btle_config:
-        lines.extend(
-            [
-                "",
-                "# BTLE Configuration (TI CC2540)",
-                f'BTLE_ENABLED="{btle_config["enabled"]}"',
-                f'BTLE_DEVICE="{btle_config["device"]}"',
-            ]
-        )
-    else:
-        lines.extend(
-            [
-                "",
-                "# BTLE Configuration (TI CC2540)",
-                'BTLE_ENABLED="false"',
-                'BTLE_DEVICE=""',
-            ]
-        )
 
-    # Add Kismet configuration
-    lines.extend(
-        [
-            "",
-            "# Kismet Configuration",
-            f'KISMET_AUTOSTART="{str(kismet_autostart).lower()}"',
-            f'KISMET_STARTUP_MODE="{kismet_startup_mode}"',
-            "",
-            f"WIFI_CAPTURE_COUNT={len(configs)}",
-            "",
-        ]
-    )
-
-    for i, cfg in enumerate(configs):
-        lines.extend(
-            [
-                f'ADAPTER_{i}_IFACE="{cfg.interface}"',
-                f'ADAPTER_{i}_MAC="{cfg.mac}"',
-                f'ADAPTER_{i}_NAME="{cfg.name}"',
-                f'ADAPTER_{i}_BANDS="{",".join(cfg.enabled_bands)}"',
-                f'ADAPTER_{i}_CHANNELS_24="{cfg.channels_24}"',
-                f'ADAPTER_{i}_CHANNELS_5="{cfg.channels_5}"',
-                f'ADAPTER_{i}_CHANNELS_6="{cfg.channels_6}"',
-                "",
-            ]
-        )
+    The header and each adapter block are rendered from module-level
+    templates and streamed into a temporary file that is then atomically
+    renamed into place. Pass fsync=True to force it to disk before the
+    rename (skipped by default for speed).
+    """
+    console = _console()
+    home_wifi = home_wifi or {}
+    btle_config = btle_config or {}
 
     # Ensure directory exists
     output = Path(output_path)
     output.parent.mkdir(parents=True, exist_ok=True)
 
-    with output.open("w") as f:
-        f.write("\n".join(lines))
+    # Write to a temporary file and rename it over the target, so an
+    # interrupted run never leaves a half-written adapters.conf behind
+    tmp_output = output.with_name(output.name + ".tmp")
+    try:
+        with tmp_output.open("w", encoding="utf-8") as f:
+            f.write(
+                CONFIG_HEADER_TEMPLATE.format(
+                    ap_iface=ap.interface,
+                    ap_mac=ap.mac.upper(),
+                    home_enabled="true" if home_wifi else "false",
+                    home_ssid=home_wifi.get("ssid", ""),
+                    home_psk=home_wifi.get("psk", ""),
+                    btle_enabled=btle_config.get("enabled", "false"),
+                    btle_device=btle_config.get("device", ""),
+                    kismet_autostart=str(kismet_autostart).lower(),
+                    kismet_startup_mode=kismet_startup_mode,
+                    count=len(configs),
+                )
+            )
+            for i, cfg in enumerate(configs):
+                f.write(
+                    CONFIG_ADAPTER_TEMPLATE.format(
+                        i=i,
+                        cfg=cfg,
+                        mac=cfg.mac.upper(),
+                        bands=",".join(cfg.enabled_bands),
+                    )
+                )
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        tmp_output.replace(output)
+    except BaseException:
+        tmp_output.unlink(missing_ok=True)
+        raise
 
     console.print(f"\n[green]Configuration saved to {output_path}[/green]")
 
 
 def main():  # noqa: PLR0912, PLR0915
     """Main entry point."""
+    _ensure_dependencies()
+    console = _console()
     console.print(
-        "\n[bold cyan]═══════════════════════════════════════════════════════════════[/bold cyan]"
+        _section_header("WarPie Adapter Configuration")
+        + "\n\nWarPie needs to know which adapter to use for each function:"
+        "\n  1. Access Point / Home WiFi - For WarPie AP and home connection"
+        "\n  2. Capture Interfaces       - For Kismet wardriving (1 or more)"
     )
-    console.print("[bold cyan]  WarPie Adapter Configuration[/bold cyan]")
-    console.print(
-        "[bold cyan]═══════════════════════════════════════════════════════════════[/bold cyan]"
+
+    # BTLE detection waits on a Kismet helper subprocess, so start it in the
+    # background and let it overlap WiFi detection and the adapter listing.
+    # A daemon thread, so the "no WiFi" exit below doesn't wait for it.
+    btle_result: list[list[BTLEAdapter]] = []
+    btle_thread = threading.Thread(
+        target=lambda: btle_result.append(detect_btle_adapters()), daemon=True
     )
-    console.print("\nWarPie needs to know which adapter to use for each function:")
-    console.print("  1. Access Point / Home WiFi - For WarPie AP and home connection")
-    console.print("  2. Capture Interfaces       - For Kismet wardriving (1 or more)")
+    btle_thread.start()
 
     # Detect adapters
     console.print("\n[blue]Detecting WiFi interfaces...[/blue]")
@@ -804,11 +1176,18 @@ def main():  # noqa: PLR0912, PLR0915
         console.print("[red]No WiFi interfaces found![/red]")
         sys.exit(1)
 
+    # Prompt/summary widgets are only needed once there is something to configure
+    from InquirerPy import inquirer
+    from rich.console import Group
+    from rich.panel import Panel
+    from rich.table import Table
+
     display_adapters(adapters)
 
     # Detect BTLE adapters
     console.print("[blue]Detecting BTLE adapters...[/blue]")
-    btle_adapters = detect_btle_adapters()
+    btle_thread.join()
+    btle_adapters = btle_result[0] if btle_result else []
     if btle_adapters:
         console.print(f"[green]✓ Found {len(btle_adapters)} BTLE adapter(s)[/green]")
     else:
@@ -823,13 +1202,9 @@ def main():  # noqa: PLR0912, PLR0915
 
     # Step 3: Configure each capture adapter
     console.print(
-        "\n[bold cyan]═══════════════════════════════════════════════════════════════[/bold cyan]"
-    )
-    console.print("[bold cyan]  Configure Capture Adapters[/bold cyan]")
-    console.print(
-        "[bold cyan]═══════════════════════════════════════════════════════════════[/bold cyan]"
+        _section_header("Configure Capture Adapters")
+        + "\n\nFor each adapter, select bands and channel configuration."
     )
-    console.print("\nFor each adapter, select bands and channel configuration.")
 
     configs = []
     total_adapters = len(capture_adapters)
@@ -838,13 +1213,7 @@ def main():  # noqa: PLR0912, PLR0915
         configs.append(config)
 
     # Step 4: Home WiFi configuration
-    console.print(
-        "\n[bold cyan]═══════════════════════════════════════════════════════════════[/bold cyan]"
-    )
-    console.print("[bold cyan]  Network Configuration[/bold cyan]")
-    console.print(
-        "[bold cyan]═══════════════════════════════════════════════════════════════[/bold cyan]"
-    )
+    console.print(_section_header("Network Configuration"))
     home_wifi = configure_home_wifi()
 
     # Step 5: Kismet auto-start and startup mode
@@ -854,13 +1223,10 @@ def main():  # noqa: PLR0912, PLR0915
     btle_config = configure_btle(btle_adapters)
 
     # Confirm
-    console.print()
-    console.print(
-        Panel.fit(
-            "[bold white]Configuration Summary[/bold white]\n\n"
-            "Review your configuration before saving:",
-            border_style="green",
-        )
+    summary_panel = Panel.fit(
+        "[bold white]Configuration Summary[/bold white]\n\n"
+        "Review your configuration before saving:",
+        border_style="green",
     )
 
     # Create detailed summary table
@@ -922,8 +1288,8 @@ def main():  # noqa: PLR0912, PLR0915
         if i < len(configs):
             summary_table.add_row("", "")  # Spacer between adapters
 
-    console.print(summary_table)
-    console.print()
+    # Render the whole summary in one print call
+    console.print(Group("", summary_panel, summary_table, ""))
 
     if inquirer.confirm(
         message="Save this configuration?", default=True, instruction="Y/n"
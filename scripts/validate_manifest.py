@@ -4,11 +4,21 @@
 This script prevents installation of incomplete packages and catches
 missing files during development/CI.
 
+Usage:
+    validate_manifest.py [--verify-hashes CHECKSUMS]
+
+With --verify-hashes, each required file is also checked against its SHA-256
+in CHECKSUMS (sha256sum format: "<hex>  <path>", paths relative to the repo
+root). Hashing is off by default so the existence check stays fast.
+
 Exit codes:
-    0: All required files present
-    1: Missing files detected
+    0: All required files present (and matching, if verifying hashes)
+    1: Missing files (or checksum mismatches) detected
 """
 
+import argparse
+import hashlib
+import os
 import sys
 from pathlib import Path
 
@@ -41,14 +51,30 @@ REQUIRED_FILES = [
 ]
 
 
-def validate_manifest() -> int:
-    """Check all required files exist."""
+def _list_files(directory: Path) -> set[str]:
+    """Return the names of the regular files in directory (empty if absent)."""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries if entry.is_file()}
+    except OSError:
+        return set()
+
+
+def validate_manifest(checksums: Path | None = None) -> int:
+    """Check all required files exist (and optionally match checksums).
+
+    Each directory named in REQUIRED_FILES is listed once and the files are
+    checked against that listing, rather than stat()ing every path.
+    """
     repo_root = Path(__file__).parent.parent
+    listings: dict[str, set[str]] = {}
     missing = []
 
     for file_path in REQUIRED_FILES:
-        full_path = repo_root / file_path
-        if not full_path.exists():
+        directory, _, name = file_path.rpartition("/")
+        if directory not in listings:
+            listings[directory] = _list_files(repo_root / directory)
+        if name not in listings[directory]:
             missing.append(file_path)
 
     if missing:
@@ -59,8 +85,60 @@ def validate_manifest() -> int:
         return 1
 
     print(f"✓ All {len(REQUIRED_FILES)} required files present")
+
+    if checksums is not None:
+        return _verify_hashes(repo_root, checksums)
+    return 0
+
+
+def _load_checksums(checksums: Path) -> dict[str, str]:
+    """Parse a sha256sum-format file into {path: hex digest}."""
+    expected = {}
+    for line in checksums.read_text().splitlines():
+        # sha256sum separates with "  " (text) or " *" (binary); anything
+        # after that separator is the path, verbatim
+        digest, _, rest = line.partition(" ")
+        if digest and rest[:1] in (" ", "*") and rest[1:]:
+            expected[rest[1:]] = digest.lower()
+    return expected
+
+
+def _verify_hashes(repo_root: Path, checksums: Path) -> int:
+    """Check every required file against its expected SHA-256."""
+    try:
+        expected = _load_checksums(checksums)
+    except (OSError, UnicodeDecodeError) as e:
+        print(f"ERROR: Cannot read checksum file: {e}")
+        return 1
+
+    mismatched = []
+    for file_path in REQUIRED_FILES:
+        if file_path not in expected:
+            mismatched.append(f"{file_path} (no checksum listed)")
+            continue
+        with (repo_root / file_path).open("rb") as f:
+            digest = hashlib.file_digest(f, "sha256").hexdigest()
+        if digest != expected[file_path]:
+            mismatched.append(file_path)
+
+    if mismatched:
+        print("ERROR: Checksum verification failed:")
+        for file in mismatched:
+            print(f"  ❌ {file}")
+        print(f"\nTotal failed: {len(mismatched)}/{len(REQUIRED_FILES)}")
+        return 1
+
+    print(f"✓ All {len(REQUIRED_FILES)} required files match {checksums.name}")
     return 0
 
 
 if __name__ == "__main__":
-    sys.exit(validate_manifest())
+    parser = argparse.ArgumentParser(description="Validate required WarPie files.")
+    parser.add_argument(
+        "--verify-hashes",
+        metavar="CHECKSUMS",
+        type=Path,
+        help="also verify SHA-256 digests against a sha256sum-format file",
+    )
+    args = parser.parse_args()
+    sys.exit(validate_manifest(args.verify_hashes))
@@ -17,9 +17,13 @@ def temp_config_dir(tmp_path):
     return config_dir
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def flask_app():
-    """Create a test Flask application instance."""
+    """Create a test Flask application instance, shared by the whole session.
+
+    create_app() is deterministic and tests don't modify the app, so it is
+    built once; each test still gets its own client via flask_client.
+    """
     from web.app import create_app
 
     app = create_app()
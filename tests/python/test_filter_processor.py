@@ -17,6 +17,7 @@ import importlib.util
 import json
 import logging
 import os
+import sqlite3
 import sys
 from pathlib import Path
 from unittest import mock
@@ -29,6 +30,8 @@ spec = importlib.util.spec_from_file_location(
     "warpie_filter_processor", str(bin_path / "warpie-filter-processor.py")
 )
 processor = importlib.util.module_from_spec(spec)
+# Registered so worker processes can unpickle its functions by name
+sys.modules[spec.name] = processor
 spec.loader.exec_module(processor)
 
 
@@ -239,6 +242,16 @@ class TestMatchesPattern:
         assert processor.matches_pattern("", rule) is True
         assert processor.matches_pattern("Network", rule) is False
 
+    def test_pattern_compiled_once(self):
+        """Test pattern rules compile their glob at creation, not per match."""
+        rule = processor.FilterRule("iPhone*", "pattern")
+        assert rule._compiled is not None
+        assert processor.FilterRule("iPhone", "exact")._compiled is None
+
+        with mock.patch.object(processor.fnmatch, "translate") as mock_translate:
+            assert processor.matches_pattern("iPhone 15", rule) is True
+            mock_translate.assert_not_called()
+
 
 # =============================================================================
 # FIND MATCHING RULE TESTS
@@ -293,6 +306,50 @@ class TestFindMatchingRule:
         assert result.value == "iPhone*"
 
 
+class TestBuildRuleMatcher:
+    """Test build_rule_matcher function."""
+
+    def test_matches_like_find_matching_rule(self):
+        """Test the fused matcher agrees with a linear scan, first rule winning."""
+        rules = [
+            processor.FilterRule("AA:BB:CC:DD:EE:FF", "bssid"),
+            processor.FilterRule("Home.Net", "exact"),
+            processor.FilterRule("iPhone*", "pattern"),
+            processor.FilterRule("iPhone 15", "exact"),
+            processor.FilterRule("Net_?", "pattern"),
+            processor.FilterRule("", "exact"),
+        ]
+        match = processor.build_rule_matcher(rules)
+        for ssid in ["Home.Net", "HomeXNet", "iPhone 15", "Net_1", "Net_12", "", "Other"]:
+            assert match(ssid) is processor.find_matching_rule(ssid, rules)
+
+    def test_no_matchable_rules(self):
+        """Test an empty or BSSID-only rule list never matches."""
+        assert processor.build_rule_matcher([])("Network") is None
+        bssid_only = [processor.FilterRule("AA:BB:CC:DD:EE:FF", "bssid")]
+        assert processor.build_rule_matcher(bssid_only)("AA:BB:CC:DD:EE:FF") is None
+
+
+class TestBuildDevicePrefilter:
+    """Test build_device_prefilter function."""
+
+    def test_rejects_blobs_without_rule_values(self):
+        """Test only blobs containing an exact rule value may match."""
+        may_match = processor.build_device_prefilter([processor.FilterRule("iPhone", "exact")])
+        assert may_match('{"dot11.advertisedssid.ssid": "iPhone"}') is True
+        assert may_match(b'{"dot11.advertisedssid.ssid": "iPhone"}') is True
+        assert may_match('{"dot11.advertisedssid.ssid": "Home"}') is False
+        assert may_match(None) is False
+
+    def test_disabled_when_unsafe(self):
+        """Test pattern rules or JSON-escaped characters disable the prefilter."""
+        assert (
+            processor.build_device_prefilter([processor.FilterRule("iPhone*", "pattern")]) is None
+        )
+        assert processor.build_device_prefilter([processor.FilterRule('Say "Hi"', "exact")]) is None
+        assert processor.build_device_prefilter([processor.FilterRule("Café", "exact")]) is None
+
+
 # =============================================================================
 # CONFIG PARSING TESTS
 # =============================================================================
@@ -462,6 +519,28 @@ Dynamic1|pattern|Dynamic
         assert static[0].value == "Static1"
         assert dynamic[0].value == "Dynamic1"
 
+    def test_unchanged_file_is_not_reparsed(self, tmp_path):
+        """Test repeated loads of an unchanged file reuse the cached rules."""
+        config_file = tmp_path / "filter_rules.conf"
+        config_file.write_text("[dynamic_exclusions]\niPhone*|pattern|iOS hotspots\n")
+        first = processor.load_all_exclusions(str(config_file))
+
+        with mock.patch("builtins.open", side_effect=AssertionError("re-read")):
+            static, dynamic = processor.load_all_exclusions(str(config_file))
+        assert (static, dynamic) == first
+        # Callers get their own lists
+        dynamic.append(processor.FilterRule("Extra", "exact"))
+        assert len(processor.load_dynamic_exclusions(str(config_file))) == 1
+
+    def test_changed_file_is_reparsed(self, tmp_path):
+        """Test the cache is invalidated when the file changes."""
+        config_file = tmp_path / "filter_rules.conf"
+        config_file.write_text("[dynamic_exclusions]\niPhone*|pattern\n")
+        assert len(processor.load_dynamic_exclusions(str(config_file))) == 1
+
+        config_file.write_text("[dynamic_exclusions]\niPhone*|pattern\nAndroid*|pattern\n")
+        assert len(processor.load_dynamic_exclusions(str(config_file))) == 2
+
 
 # =============================================================================
 # SSID EXTRACTION FROM DEVICE JSON TESTS
@@ -598,6 +677,63 @@ class TestExtractSsidsFromDevice:
         assert len(ssids) == 1
         assert "ValidNetwork" in ssids
 
+    def test_extract_from_blob_bytes(self):
+        """Test extracting SSIDs from a device BLOB returned as bytes."""
+        device_json = json.dumps(
+            {
+                "dot11.device": {
+                    "dot11.device.advertised_ssid_map": [{"dot11.advertisedssid.ssid": "BlobNet"}]
+                }
+            }
+        ).encode()
+        assert processor.extract_ssids_from_device(device_json) == ["BlobNet"]
+
+    def test_extract_skips_parse_without_ssid_keys(self):
+        """Test devices with no SSID entries are not JSON-parsed."""
+        device_json = json.dumps({"dot11.device": {"dot11.device.num_probed_ssids": 0}})
+        with mock.patch.object(processor, "_JSON_DECODER") as mock_decoder:
+            assert processor.extract_ssids_from_device(device_json) == []
+            mock_decoder.raw_decode.assert_not_called()
+
+    def test_extract_decodes_only_ssid_maps(self, mocker):
+        """Test only the two SSID map arrays are decoded, escapes included."""
+        device_json = json.dumps(
+            {
+                "kismet.device.base.signal": {"kismet.common.signal.signal_rrd": [1, 2, 3]},
+                "dot11.device": {
+                    "dot11.device.advertised_ssid_map": [
+                        {"dot11.advertisedssid.ssid": "Café"},
+                        {"dot11.advertisedssid.ssid": 'Say "Hi" [x]'},
+                        {"dot11.advertisedssid.ssid": ""},
+                    ],
+                    "dot11.device.probed_ssid_map": [{"dot11.probedssid.ssid": "Plain"}],
+                },
+            }
+        )
+        raw_decode = mocker.spy(processor._JSON_DECODER, "raw_decode")
+        ssids = processor.extract_ssids_from_device(device_json)
+        assert ssids == ["Café", 'Say "Hi" [x]', "Plain"]
+        assert raw_decode.call_count == 2
+
+    def test_extract_ignores_ssids_outside_maps(self):
+        """Test responded/last-beaconed records do not contribute SSIDs."""
+        device_json = json.dumps(
+            {
+                "dot11.device": {
+                    "dot11.device.last_beaconed_ssid_record": {
+                        "dot11.advertisedssid.ssid": "LastBeacon"
+                    },
+                    "dot11.device.advertised_ssid_map": [{"dot11.advertisedssid.ssid": ""}],
+                    "dot11.device.responded_ssid_map": [
+                        {"dot11.advertisedssid.ssid": "HiddenHome"}
+                    ],
+                    "dot11.device.last_probed_ssid_record": {"dot11.probedssid.ssid": "Probe"},
+                }
+            }
+        )
+        assert processor.extract_ssids_from_device(device_json) == []
+        assert processor.extract_ssids_from_device(device_json.encode()) == []
+
 
 # =============================================================================
 # WIGLE CSV PROCESSING TESTS
@@ -626,6 +762,18 @@ AA:BB:CC:DD:EE:FF,TestNetwork1,47.0,122.0,1,1,WPA2
         assert result.original_count == 2
         assert result.removed_count == 1
 
+    def test_process_wigle_csv_short_files(self, tmp_path):
+        """Test empty and header-only files are reported as too short."""
+        rules = [processor.FilterRule("TestNetwork1", "exact")]
+        for content in ["", "# WiGLE Header Line 1\n"]:
+            csv_file = tmp_path / "networks.wiglecsv"
+            csv_file.write_text(content)
+
+            result = processor.process_wigle_csv(str(csv_file), rules)
+
+            assert "too short" in result.error
+            assert result.original_count == 0
+
     def test_process_wigle_csv_remove_matching_entry(self, tmp_path):
         """Test removing matching entry from CSV."""
         csv_file = tmp_path / "networks.wiglecsv"
@@ -699,6 +847,27 @@ ShortLine
         # All data lines are counted, including short ones
         assert result.original_count == 3
 
+    def test_process_wigle_csv_quoted_ssid(self, tmp_path):
+        """Test SSIDs quoted for containing commas are unquoted before matching."""
+        csv_file = tmp_path / "networks.wiglecsv"
+        csv_file.write_text(
+            "# Header1\n"
+            "# Header2\n"
+            'AA:BB:CC:DD:EE:FF,"Joe\'s, Cafe",47.0,122.0,1,1,WPA2\n'
+            '11:22:33:44:55:66,"Say ""Hi""",47.0,122.0,1,1,WPA2\n'
+            "33:44:55:66:77:88,KeepMe,47.0,122.0,1,1,WPA2\n"
+        )
+
+        rules = [
+            processor.FilterRule("Joe's, Cafe", "exact"),
+            processor.FilterRule('Say "*', "pattern"),
+        ]
+        result = processor.process_wigle_csv(str(csv_file), rules, dry_run=False)
+
+        assert result.removed_count == 2
+        assert [m["ssid"] for m in result.matches] == ["Joe's, Cafe", 'Say "Hi"']
+        assert "KeepMe" in csv_file.read_text()
+
 
 class TestScanWigleCsv:
     """Test scan_wigle_csv function."""
@@ -751,6 +920,19 @@ class TestBackupManagement:
         assert backup_file.exists()
         assert backup_file.read_text() == "test content"
 
+    def test_create_backup_independent_of_source(self, tmp_path):
+        """Test that rewriting a source file in place leaves its backup intact."""
+        source_file = tmp_path / "source.txt"
+        source_file.write_text("test content")
+        os.utime(source_file, (1_000_000_000, 1_000_000_000))
+
+        backup_path = processor.create_backup([str(source_file)], str(tmp_path / "backups"))
+        source_file.write_text("sanitized")
+
+        backup_file = Path(backup_path) / "source.txt"
+        assert backup_file.read_text() == "test content"
+        assert backup_file.stat().st_mtime == 1_000_000_000
+
     def test_create_backup_multiple_files(self, tmp_path):
         """Test creating backup of multiple files."""
         file1 = tmp_path / "file1.txt"
@@ -941,6 +1123,16 @@ class TestFileDiscovery:
         is_in_use = processor.is_file_in_use(str(nonexistent))
         assert is_in_use is False
 
+    def test_is_file_in_use_precomputed_stat(self, tmp_path):
+        """Test is_file_in_use uses a caller's stat result instead of the file."""
+        test_file = tmp_path / "test.kismet"
+        test_file.touch()
+        old_stat = test_file.stat()
+        os.utime(test_file, (old_stat.st_atime - 100, old_stat.st_mtime - 100))
+
+        assert processor.is_file_in_use(str(test_file), old_stat) is True
+        assert processor.is_file_in_use(str(test_file)) is False
+
 
 # =============================================================================
 # FORMAT SIZE TESTS
@@ -1030,7 +1222,7 @@ class TestProcessKismetdb:
         mock_connect = mocker.patch("sqlite3.connect")
         mock_cursor = mock.MagicMock()
         mock_connect.return_value.cursor.return_value = mock_cursor
-        mock_cursor.fetchall.return_value = []
+        mock_cursor.__iter__.return_value = iter([])
 
         rules = [processor.FilterRule("Test", "exact")]
 
@@ -1085,10 +1277,12 @@ class TestProcessKismetdb:
             }
         )
 
-        mock_cursor.fetchall.return_value = [
-            (1, "AA:BB:CC:DD:EE:FF", device_json_match),
-            (2, "11:22:33:44:55:66", device_json_nomatch),
-        ]
+        mock_cursor.__iter__.return_value = iter(
+            [
+                (1, "AA:BB:CC:DD:EE:FF", device_json_match),
+                (2, "11:22:33:44:55:66", device_json_nomatch),
+            ]
+        )
 
         rules = [processor.FilterRule("MatchingSSID", "exact")]
         result = processor.process_kismetdb(str(db_file), rules, dry_run=True)
@@ -1097,6 +1291,38 @@ class TestProcessKismetdb:
         assert result.original_count == 2
         assert result.removed_count == 1
 
+    def test_process_kismetdb_batched_deletes(self, tmp_path, monkeypatch):
+        """Test matched devices and their packets are deleted across batches."""
+        monkeypatch.setattr(processor, "SQLITE_BATCH_SIZE", 2)
+        db_file = tmp_path / "test.kismet"
+        conn = sqlite3.connect(db_file)
+        conn.execute("CREATE TABLE devices (key INT, devmac TEXT, phyname TEXT, device TEXT)")
+        conn.execute("CREATE TABLE packets (sourcemac TEXT, destmac TEXT)")
+        for key in range(5):
+            ssid = "iPhone" if key < 3 else "Home"
+            device = json.dumps(
+                {
+                    "dot11.device": {
+                        "dot11.device.advertised_ssid_map": [{"dot11.advertisedssid.ssid": ssid}]
+                    }
+                }
+            )
+            mac = f"00:00:00:00:00:0{key}"
+            conn.execute("INSERT INTO devices VALUES (?, ?, 'IEEE802.11', ?)", (key, mac, device))
+            conn.execute("INSERT INTO packets VALUES (?, 'FF:FF:FF:FF:FF:FF')", (mac,))
+        conn.commit()
+        conn.close()
+
+        rules = [processor.FilterRule("iPhone", "exact")]
+        result = processor.process_kismetdb(str(db_file), rules)
+
+        assert result.success is True
+        assert result.removed_count == 3
+        conn = sqlite3.connect(db_file)
+        assert conn.execute("SELECT key FROM devices ORDER BY key").fetchall() == [(3,), (4,)]
+        assert conn.execute("SELECT COUNT(*) FROM packets").fetchone() == (2,)
+        conn.close()
+
 
 class TestScanKismetdb:
     """Test scan_kismetdb function."""
@@ -1109,7 +1335,7 @@ class TestScanKismetdb:
         mock_connect = mocker.patch("sqlite3.connect")
         mock_cursor = mock.MagicMock()
         mock_connect.return_value.cursor.return_value = mock_cursor
-        mock_cursor.fetchall.return_value = []
+        mock_cursor.__iter__.return_value = iter([])
 
         rules = [processor.FilterRule("Test", "exact")]
         result = processor.scan_kismetdb(str(db_file), rules)
@@ -1160,6 +1386,26 @@ AA:BB:CC:DD:EE:FF,Network1,47.0,122.0,1,1,WPA2
 
         assert preview["total_entries"] == 1
 
+    def test_preview_sanitization_parallel_matches_serial(self, tmp_path, mocker):
+        """Test scanning files in worker processes gives the same preview."""
+        for index in range(3):
+            (tmp_path / f"test{index}.wiglecsv").write_text(
+                "# H1\n# H2\n"
+                f"AA:BB:CC:DD:EE:0{index},Network1,47.0,122.0,1,1,WPA2\n"
+                f"AA:BB:CC:DD:EE:1{index},Other,47.0,122.0,1,1,WPA2\n"
+            )
+
+        rules = [processor.FilterRule("Network1", "exact")]
+        mocker.patch.object(processor, "is_file_in_use", return_value=False)
+        mocker.patch.object(processor.os, "cpu_count", return_value=1)
+        serial = processor.preview_sanitization(str(tmp_path), rules)
+        mocker.patch.object(processor.os, "cpu_count", return_value=2)
+        parallel = processor.preview_sanitization(str(tmp_path), rules)
+
+        assert parallel == serial
+        assert parallel["total_entries"] == 6
+        assert parallel["total_matches"] == 3
+
     def test_preview_sanitization_skips_in_use_files(self, tmp_path):
         """Test that preview skips files currently in use."""
         csv_file = tmp_path / "test.wiglecsv"
@@ -1348,6 +1594,26 @@ TestNetwork|exact|Test
         # Should not call find_kismetdb_files
         mock_find.assert_not_called()
 
+    def test_daemon_skips_unchanged_files(self, tmp_path, mocker):
+        """Test daemon processes an idle file once until it is modified again."""
+        db_file = tmp_path / "capture.kismet"
+        db_file.touch()
+        os.utime(db_file, (1_000_000_000, 1_000_000_000))
+
+        daemon = processor.FilterDaemon(str(tmp_path))
+        daemon.rules = [processor.FilterRule("Test", "exact")]
+        mock_process = mocker.patch.object(
+            processor, "process_kismetdb", return_value=processor.ProcessingResult(str(db_file))
+        )
+
+        daemon.process_pending_files()
+        daemon.process_pending_files()
+        assert mock_process.call_count == 1
+
+        os.utime(db_file, (1_000_000_100, 1_000_000_100))
+        daemon.process_pending_files()
+        assert mock_process.call_count == 2
+
 
 # =============================================================================
 # INTEGRATION-STYLE TESTS
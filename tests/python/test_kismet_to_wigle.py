@@ -12,6 +12,7 @@ Tests cover:
 Uses pytest fixtures and mocking for isolation.
 """
 
+import csv
 import importlib.util
 import json
 import sqlite3
@@ -29,6 +30,8 @@ spec = importlib.util.spec_from_file_location(
     "warpie_kismet_to_wigle", str(bin_path / "warpie-kismet-to-wigle.py")
 )
 wigle_exporter = importlib.util.module_from_spec(spec)
+# Register so worker processes can unpickle DeviceRecord results
+sys.modules[spec.name] = wigle_exporter
 spec.loader.exec_module(wigle_exporter)
 
 
@@ -116,6 +119,22 @@ class TestDeviceRecordDataclass:
         assert record.device_type == "WIFI"
         assert record.phy_name == "IEEE802.11"
 
+    def test_device_record_is_slotted(self):
+        """Test DeviceRecord instances carry no per-instance __dict__."""
+        record = wigle_exporter.DeviceRecord(
+            mac="AA:BB:CC:DD:EE:FF",
+            name="Test",
+            auth_mode="",
+            first_seen=datetime.now(),
+            channel=1,
+            rssi=-70,
+            latitude=0.0,
+            longitude=0.0,
+        )
+        assert not hasattr(record, "__dict__")
+        with pytest.raises(AttributeError):
+            record.ssid = "Typo"
+
 
 class TestExportConfigDataclass:
     """Test ExportConfig dataclass."""
@@ -235,6 +254,23 @@ class TestFormatDeviceRow:
         assert "-122.3321" in row
         assert "WIFI" in row
 
+    def test_format_full_row(self):
+        """Test the exact row layout, with the timestamp cut to whole seconds."""
+        device = wigle_exporter.DeviceRecord(
+            mac="AA:BB:CC:DD:EE:FF",
+            name="TestNetwork",
+            auth_mode="WPA2",
+            first_seen=datetime(2024, 1, 2, 3, 4, 5, 678901),
+            channel=6,
+            rssi=-65,
+            latitude=47.6062,
+            longitude=-122.3321,
+        )
+        assert wigle_exporter.format_device_row(device) == (
+            "AA:BB:CC:DD:EE:FF,TestNetwork,WPA2,2024-01-02 03:04:05,6,-65,"
+            "47.606200,-122.332100,0.0,0.0,WIFI"
+        )
+
     def test_format_btle_device(self):
         """Test formatting a BTLE device row."""
         device = wigle_exporter.DeviceRecord(
@@ -287,6 +323,12 @@ class TestFormatDeviceRow:
         # The SSID should be quoted or escaped
         assert "Network" in row
 
+    def test_escaped_names_round_trip_through_csv_reader(self):
+        """Test escaped names parse back unchanged with the csv module."""
+        for name in ["Plain", "a,b", 'Say "Hi"', "two\nlines", "carriage\rreturn", ""]:
+            escaped = wigle_exporter._escape_csv(name)
+            assert next(csv.reader([f"x,{escaped},y"])) == ["x", name, "y"]
+
 
 # =============================================================================
 # RATE LIMITING TESTS
@@ -650,6 +692,12 @@ class TestDatabaseExtraction:
         wifi_devices = wigle_exporter.extract_wifi_devices(temp_kismetdb)
         assert wifi_devices == []
 
+    def test_extract_missing_db_does_not_create_it(self, tmp_path):
+        """Test read-only extraction of a missing path leaves no empty db behind."""
+        db_path = tmp_path / "missing.kismet"
+        assert wigle_exporter.extract_wifi_devices(str(db_path)) == []
+        assert not db_path.exists()
+
     def test_extract_wifi_device(self, temp_kismetdb):
         """Test extracting a WiFi device."""
         conn = sqlite3.connect(temp_kismetdb)
@@ -775,6 +823,75 @@ class TestExportToWigle:
         assert result.success is True
         assert result.stats.files_processed == 1
 
+    def test_export_multiple_files_in_parallel(self, tmp_path, monkeypatch):
+        """Test multi-file export through the process pool keeps input order."""
+        macs = ["AA:AA:AA:AA:AA:01", "AA:AA:AA:AA:AA:02", "AA:AA:AA:AA:AA:03"]
+        input_files = []
+        for i, mac in enumerate(macs):
+            db_path = tmp_path / f"test{i}.kismet"
+            conn = sqlite3.connect(db_path)
+            conn.execute("""
+                CREATE TABLE devices (
+                    devmac TEXT, phyname TEXT, type TEXT, device TEXT,
+                    first_time INTEGER, avg_lat REAL, avg_lon REAL, avg_alt REAL
+                )
+            """)
+            device_json = json.dumps({"kismet.device.base.macaddr": mac})
+            conn.execute(
+                "INSERT INTO devices VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (mac, "IEEE802.11", "Wi-Fi AP", device_json, 1704067200, 47.6, -122.3, 0),
+            )
+            conn.commit()
+            conn.close()
+            input_files.append(str(db_path))
+        monkeypatch.setattr(wigle_exporter.os, "cpu_count", lambda: 2)
+
+        config = wigle_exporter.ExportConfig(
+            input_files=input_files, include_btle=False, include_bt=False, rate_limit=False
+        )
+        result = wigle_exporter.export_to_wigle(config)
+
+        assert result.success is True
+        assert result.stats.files_processed == 3
+        assert result.stats.wifi_count == 3
+        assert [d.mac for d in result.devices] == macs
+
+    def test_export_filters_exclusion_zones(self, tmp_path, monkeypatch):
+        """Test devices inside any zone are dropped, including between zones."""
+        db_path = tmp_path / "test.kismet"
+        db_path.touch()
+        points = {
+            "00:00:00:00:00:01": (47.05, -122.45),  # In zone 1
+            "00:00:00:00:00:02": (48.05, -123.45),  # In zone 2
+            "00:00:00:00:00:03": (47.5, -123.0),  # Between zones
+            "00:00:00:00:00:04": (10.0, 10.0),  # Far away
+        }
+        devices = [
+            wigle_exporter.DeviceRecord(
+                mac=mac,
+                name="Net",
+                auth_mode="OPEN",
+                first_seen=datetime(2024, 1, 1, 12, 0, 0),
+                channel=6,
+                rssi=-60,
+                latitude=lat,
+                longitude=lon,
+            )
+            for mac, (lat, lon) in points.items()
+        ]
+        monkeypatch.setattr(wigle_exporter, "extract_wifi_devices", lambda _: devices)
+
+        config = wigle_exporter.ExportConfig(
+            input_files=[str(db_path)],
+            include_btle=False,
+            include_bt=False,
+            exclusion_zones=[(47.0, -122.5, 47.1, -122.4), (48.0, -123.5, 48.1, -123.4)],
+        )
+        result = wigle_exporter.export_to_wigle(config)
+
+        assert [d.mac for d in result.devices] == ["00:00:00:00:00:03", "00:00:00:00:00:04"]
+        assert result.stats.filtered_count == 2
+
 
 # =============================================================================
 # COLOR OUTPUT TESTS
@@ -823,6 +940,15 @@ class TestGlobPatternExpansion:
         assert any("test1.kismet" in r for r in result)
         assert any("test2.kismet" in r for r in result)
 
+    def test_expand_glob_pattern_relative_is_sorted_and_absolute(self, tmp_path, monkeypatch):
+        """Test relative patterns resolve against cwd in a stable order."""
+        for name in ("c.kismet", "a.kismet", "b.kismet"):
+            (tmp_path / name).touch()
+        monkeypatch.chdir(tmp_path)
+
+        result = wigle_exporter.expand_glob_pattern("*.kismet")
+        assert result == [str(tmp_path / n) for n in ("a.kismet", "b.kismet", "c.kismet")]
+
 
 # =============================================================================
 # INTEGRATION TESTS
@@ -627,13 +627,9 @@ class TestPerformanceRoutes:
     """Tests for performance API routes."""
 
     @pytest.fixture
-    def client(self):
+    def client(self, flask_client):
         """Create test client."""
-        from web.app import create_app
-
-        app = create_app()
-        app.config["TESTING"] = True
-        return app.test_client()
+        return flask_client
 
     @patch("web.routes.performance.get_cpu_temperature")
     @patch("web.routes.performance.get_disk_usage")
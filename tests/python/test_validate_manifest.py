@@ -0,0 +1,97 @@
+"""Unit tests for scripts/validate_manifest.py checksum verification."""
+
+import hashlib
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+scripts_path = Path(__file__).parent.parent.parent / "scripts"
+
+# Import the script as a module
+spec = importlib.util.spec_from_file_location(
+    "validate_manifest", str(scripts_path / "validate_manifest.py")
+)
+validate_manifest = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(validate_manifest)
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    """A fake repo with two required files."""
+    (tmp_path / "bin").mkdir()
+    (tmp_path / "bin" / "tool.sh").write_bytes(b"#!/bin/sh\necho hi\n")
+    (tmp_path / "README").write_bytes(b"readme\n")
+    monkeypatch.setattr(validate_manifest, "REQUIRED_FILES", ["bin/tool.sh", "README"])
+    return tmp_path
+
+
+def _sha256(path: Path) -> str:
+    """Return the hex SHA-256 digest of a file."""
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+class TestLoadChecksums:
+    """Test sha256sum-format parsing."""
+
+    def test_text_and_binary_separators(self, tmp_path):
+        """Test both "  " and " *" separators yield the verbatim path."""
+        checksums = tmp_path / "CHECKSUMS"
+        checksums.write_text("ABC  bin/tool.sh\ndef *README\n")
+        assert validate_manifest._load_checksums(checksums) == {
+            "bin/tool.sh": "abc",
+            "README": "def",
+        }
+
+    def test_leading_star_and_space_in_path_kept(self, tmp_path):
+        """Test only the separator is stripped, not leading * or spaces in paths."""
+        checksums = tmp_path / "CHECKSUMS"
+        checksums.write_text("abc  *starred\ndef *  spaced\n")
+        assert validate_manifest._load_checksums(checksums) == {
+            "*starred": "abc",
+            "  spaced": "def",
+        }
+
+    def test_malformed_lines_skipped(self, tmp_path):
+        """Test lines without a valid separator and path are ignored."""
+        checksums = tmp_path / "CHECKSUMS"
+        checksums.write_text("abc\nabc x\nabc  \n\n")
+        assert validate_manifest._load_checksums(checksums) == {}
+
+
+class TestVerifyHashes:
+    """Test --verify-hashes checking of required files."""
+
+    def test_matching_files(self, repo, capsys):
+        """Test matching digests pass."""
+        checksums = repo / "CHECKSUMS"
+        checksums.write_text(
+            f"{_sha256(repo / 'bin/tool.sh')}  bin/tool.sh\n{_sha256(repo / 'README')} *README\n"
+        )
+        assert validate_manifest._verify_hashes(repo, checksums) == 0
+        assert "match CHECKSUMS" in capsys.readouterr().out
+
+    def test_mismatch(self, repo, capsys):
+        """Test a changed file fails verification."""
+        checksums = repo / "CHECKSUMS"
+        checksums.write_text(f"{_sha256(repo / 'bin/tool.sh')}  bin/tool.sh\n{'0' * 64}  README\n")
+        assert validate_manifest._verify_hashes(repo, checksums) == 1
+        out = capsys.readouterr().out
+        assert "❌ README" in out
+        assert "bin/tool.sh" not in out
+
+    def test_missing_entry(self, repo, capsys):
+        """Test a required file without a listed checksum fails verification."""
+        checksums = repo / "CHECKSUMS"
+        checksums.write_text(f"{_sha256(repo / 'bin/tool.sh')}  bin/tool.sh\n")
+        assert validate_manifest._verify_hashes(repo, checksums) == 1
+        assert "README (no checksum listed)" in capsys.readouterr().out
+
+    @pytest.mark.parametrize("content", [None, b"\xff\xfe not utf-8\n"])
+    def test_unreadable_checksums(self, repo, capsys, content):
+        """Test a missing or undecodable CHECKSUMS file fails cleanly."""
+        checksums = repo / "CHECKSUMS"
+        if content is not None:
+            checksums.write_bytes(content)
+        assert validate_manifest._verify_hashes(repo, checksums) == 1
+        assert "Cannot read checksum file" in capsys.readouterr().out
@@ -0,0 +1,873 @@
+"""Unit tests for install/warpie_config.py.
+
+Tests cover:
+- nl80211 netlink encoding, parsing and band dumps (mocked socket)
+- iw phy text parsing and streaming (mocked subprocess)
+- Interface discovery from a fake sysfs tree
+- Adapter band cache hits, misses and corrupt files
+- Band probe skipping for single-band drivers
+- BTLE adapter list parsing
+- Early exit of main() when no WiFi adapters are found
+- WPA PSK derivation
+- adapters.conf writing: atomic replace, fsync and rendered output
+
+Uses pytest fixtures and mocking for isolation.
+"""
+
+import errno
+import importlib.util
+import json
+import struct
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+install_path = Path(__file__).parent.parent.parent / "install"
+
+# Import the installer step as a module
+spec = importlib.util.spec_from_file_location(
+    "warpie_config", str(install_path / "warpie_config.py")
+)
+warpie_config = importlib.util.module_from_spec(spec)
+# Register before executing: dataclasses resolve string annotations through it
+sys.modules[spec.name] = warpie_config
+spec.loader.exec_module(warpie_config)
+
+
+# =============================================================================
+# NL80211 NETLINK TESTS
+# =============================================================================
+
+NL80211_FAMILY_ID = 0x1C
+
+
+def _genl_msg(attrs: bytes, msg_type: int = NL80211_FAMILY_ID) -> bytes:
+    """Build one generic netlink reply: nlmsghdr + genlmsghdr + attributes."""
+    header = struct.pack("=IHHII", 20 + len(attrs), msg_type, 0, 1, 0)
+    return header + struct.pack("=BBH", 1, 1, 0) + attrs
+
+
+def _done_msg() -> bytes:
+    """Build an NLMSG_DONE message."""
+    return struct.pack("=IHHIIi", 20, warpie_config._NLMSG_DONE, 0, 1, 0, 0)
+
+
+def _error_msg(error: int) -> bytes:
+    """Build an NLMSG_ERROR message carrying a negative errno (0 is an ACK)."""
+    original = struct.pack("=IHHII", 16, NL80211_FAMILY_ID, 0, 1, 0)
+    return struct.pack("=IHHIIi", 36, warpie_config._NLMSG_ERROR, 0, 1, 0, error) + original
+
+
+def _family_reply() -> bytes:
+    """Build the controller's answer to the nl80211 family lookup."""
+    attrs = warpie_config._nla(warpie_config._CTRL_ATTR_FAMILY_NAME, b"nl80211\0")
+    attrs += warpie_config._nla(
+        warpie_config._CTRL_ATTR_FAMILY_ID, struct.pack("=H", NL80211_FAMILY_ID)
+    )
+    return _genl_msg(attrs, warpie_config._GENL_ID_CTRL)
+
+
+def _wiphy_msg(wiphy: int, bands: tuple[int, ...] = ()) -> bytes:
+    """Build one split-dump message for a phy, optionally listing bands."""
+    attrs = warpie_config._nla(warpie_config._NL80211_ATTR_WIPHY, struct.pack("=I", wiphy))
+    if bands:
+        nested = b"".join(warpie_config._nla(band, b"\0" * 8) for band in bands)
+        attrs += warpie_config._nla(warpie_config._NL80211_ATTR_WIPHY_BANDS, nested)
+    return _genl_msg(attrs)
+
+
+class FakeNetlinkSocket:
+    """Netlink socket double that replays canned recv() chunks.
+
+    Once the chunks run out, recv() raises TimeoutError if a timeout was
+    set, standing in for a kernel that never sends NLMSG_DONE.
+    """
+
+    def __init__(self, *chunks: bytes):
+        self.chunks = list(chunks)
+        self.sent: list[bytes] = []
+        self.timeout = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def settimeout(self, timeout):
+        self.timeout = timeout
+
+    def send(self, data):
+        self.sent.append(data)
+        return len(data)
+
+    def recv(self, size):
+        if self.chunks:
+            return self.chunks.pop(0)
+        if self.timeout is None:
+            raise AssertionError("recv() would block forever")
+        raise TimeoutError("timed out")
+
+
+class TestNetlinkAttributes:
+    """Test netlink attribute encoding and parsing."""
+
+    def test_nla_pads_to_four_bytes(self):
+        """Test attributes are length-prefixed and padded to 4-byte alignment."""
+        encoded = warpie_config._nla(7, b"abcde")
+        assert len(encoded) == 12
+        assert struct.unpack_from("=HH", encoded) == (9, 7)
+
+    def test_nla_parse_round_trip(self):
+        """Test parsing yields each attribute's type and unpadded payload."""
+        data = warpie_config._nla(1, b"abc") + warpie_config._nla(2) + warpie_config._nla(3, b"xy")
+        assert list(warpie_config._nla_parse(data)) == [(1, b"abc"), (2, b""), (3, b"xy")]
+
+    def test_nla_parse_masks_nested_flag(self):
+        """Test the NLA_F_NESTED/NET_BYTEORDER flag bits are stripped from types."""
+        data = warpie_config._nla(22 | 0x8000, b"")
+        assert list(warpie_config._nla_parse(data)) == [(22, b"")]
+
+
+class TestNl80211Family:
+    """Test the generic netlink family lookup."""
+
+    def test_family_lookup(self):
+        """Test the family id is read from the controller reply."""
+        sock = FakeNetlinkSocket(_family_reply())
+        assert warpie_config._nl80211_family(sock) == NL80211_FAMILY_ID
+
+        # Request went to the controller and named the nl80211 family
+        (request,) = sock.sent
+        _, msg_type, flags, _, _ = struct.unpack_from("=IHHII", request)
+        assert msg_type == warpie_config._GENL_ID_CTRL
+        assert flags == warpie_config._NLM_F_REQUEST
+        assert request[16] == warpie_config._CTRL_CMD_GETFAMILY
+        assert list(warpie_config._nla_parse(request[20:])) == [
+            (warpie_config._CTRL_ATTR_FAMILY_NAME, b"nl80211\0")
+        ]
+
+    def test_family_missing(self):
+        """Test a reply without a family id raises OSError."""
+        sock = FakeNetlinkSocket(_genl_msg(b"", warpie_config._GENL_ID_CTRL))
+        with pytest.raises(OSError, match="nl80211"):
+            warpie_config._nl80211_family(sock)
+
+    def test_family_error(self):
+        """Test an NLMSG_ERROR reply is raised as OSError with its errno."""
+        sock = FakeNetlinkSocket(_error_msg(-errno.ENOENT))
+        with pytest.raises(OSError) as exc_info:
+            warpie_config._nl80211_family(sock)
+        assert exc_info.value.errno == errno.ENOENT
+
+
+class TestGenlRequest:
+    """Test generic netlink request/reply handling."""
+
+    def test_dump_reads_until_done(self):
+        """Test a dump spans several recv() chunks and stops at NLMSG_DONE."""
+        first, second = _wiphy_msg(0), _wiphy_msg(1)
+        sock = FakeNetlinkSocket(first + second, _wiphy_msg(2) + _done_msg(), b"unread")
+        replies = warpie_config._genl_request(
+            sock, NL80211_FAMILY_ID, 1, b"", warpie_config._NLM_F_DUMP
+        )
+        assert len(replies) == 3
+        assert replies[0] == first[20:]
+        assert sock.chunks == [b"unread"]
+
+    def test_ack_ends_request(self):
+        """Test an NLMSG_ERROR with error 0 (ACK) ends the request cleanly."""
+        sock = FakeNetlinkSocket(_wiphy_msg(0) + _error_msg(0))
+        replies = warpie_config._genl_request(
+            sock, NL80211_FAMILY_ID, 1, b"", warpie_config._NLM_F_DUMP
+        )
+        assert len(replies) == 1
+
+    def test_error_raises_oserror(self):
+        """Test a kernel error mid-dump is raised as OSError."""
+        sock = FakeNetlinkSocket(_wiphy_msg(0), _error_msg(-errno.ENODEV))
+        with pytest.raises(OSError) as exc_info:
+            warpie_config._genl_request(sock, NL80211_FAMILY_ID, 1, b"", warpie_config._NLM_F_DUMP)
+        assert exc_info.value.errno == errno.ENODEV
+
+
+class TestDumpPhyBands:
+    """Test the nl80211 wiphy dump used for band detection."""
+
+    def test_split_dump_merges_messages_per_phy(self, mocker):
+        """Test bands spread over several messages per phy are merged."""
+        sock = FakeNetlinkSocket(
+            _family_reply(),
+            _wiphy_msg(0) + _wiphy_msg(0, (0,)) + _wiphy_msg(1, (0,)),
+            _wiphy_msg(0, (1,)) + _wiphy_msg(1, (3,)) + _wiphy_msg(1, (2,)),
+            _wiphy_msg(1) + _done_msg(),
+        )
+        mocker.patch.object(warpie_config.socket, "socket", return_value=sock)
+
+        assert warpie_config._dump_phy_bands() == {
+            0: ["2.4GHz", "5GHz"],
+            1: ["2.4GHz", "6GHz"],
+        }
+        assert sock.timeout == warpie_config._NL_TIMEOUT
+
+        # Dump request: split dump flag, no phy filter
+        _, msg_type, flags, _, _ = struct.unpack_from("=IHHII", sock.sent[1])
+        assert msg_type == NL80211_FAMILY_ID
+        assert flags & warpie_config._NLM_F_DUMP == warpie_config._NLM_F_DUMP
+        attr_types = [t for t, _ in warpie_config._nla_parse(sock.sent[1][20:])]
+        assert attr_types == [warpie_config._NL80211_ATTR_SPLIT_WIPHY_DUMP]
+
+    def test_filtered_dump_sends_phy_index(self, mocker):
+        """Test a single-phy dump carries the wiphy index attribute."""
+        sock = FakeNetlinkSocket(_family_reply(), _wiphy_msg(3, (0, 1)) + _done_msg())
+        mocker.patch.object(warpie_config.socket, "socket", return_value=sock)
+
+        assert warpie_config._dump_phy_bands(3) == {3: ["2.4GHz", "5GHz"]}
+        attrs = dict(warpie_config._nla_parse(sock.sent[1][20:]))
+        assert attrs[warpie_config._NL80211_ATTR_WIPHY] == struct.pack("=I", 3)
+
+    def test_stalled_dump_times_out(self, mocker):
+        """Test a dump that never sends NLMSG_DONE raises instead of hanging."""
+        sock = FakeNetlinkSocket(_family_reply(), _wiphy_msg(0, (0,)))
+        mocker.patch.object(warpie_config.socket, "socket", return_value=sock)
+
+        with pytest.raises(OSError):
+            warpie_config._dump_phy_bands()
+
+    def test_detect_bands_falls_back_to_iw_on_timeout(self, mocker):
+        """Test a stalled netlink dump falls back to iw band detection."""
+        sock = FakeNetlinkSocket(_family_reply(), _wiphy_msg(0, (0,)))
+        mocker.patch.object(warpie_config.socket, "socket", return_value=sock)
+        mocker.patch.object(warpie_config, "_read_sysfs", return_value="0")
+        iw_bands = mocker.patch.object(
+            warpie_config, "_iw_phy_bands", return_value=["2.4GHz", "5GHz"]
+        )
+
+        assert warpie_config.detect_bands("wlan0") == ["2.4GHz", "5GHz"]
+        iw_bands.assert_called_once()
+
+
+# =============================================================================
+# IW BAND PARSING TESTS
+# =============================================================================
+
+# Trimmed "iw phy" output for two phys: a dual-band and a tri-band adapter
+IW_PHY_DUMP = b"""\
+Wiphy phy0
+\twiphy index: 0
+\tmax # scan SSIDs: 4
+\tBand 1:
+\t\tCapabilities: 0x1862
+\t\tFrequencies:
+\t\t\t* 2412 MHz [1] (20.0 dBm)
+\tBand 2:
+\t\tCapabilities: 0x1862
+\t\tFrequencies:
+\t\t\t* 5180 MHz [36] (20.0 dBm)
+\tSupported commands:
+\t\t * new_interface
+Wiphy phy1
+\twiphy index: 1
+\tBand 1:
+\t\tFrequencies:
+\t\t\t* 2412 MHz [1] (20.0 dBm)
+\tBand 2:
+\t\tFrequencies:
+\t\t\t* 5180 MHz [36] (20.0 dBm)
+\tBand 4:
+\t\tFrequencies:
+\t\t\t* 5955 MHz [1] (disabled)
+\tSupported commands:
+\t\t * new_interface
+"""
+
+# Trimmed "iw phy phy2 info" output for a 2.4GHz-only adapter
+IW_PHY_INFO = b"""\
+Wiphy phy2
+\twiphy index: 2
+\tBand 1:
+\t\tFrequencies:
+\t\t\t* 2412 MHz [1] (20.0 dBm)
+\tSupported commands:
+\t\t * new_interface
+\t\t * set_wiphy
+\tBand 2:
+"""
+
+
+class FakePopen:
+    """subprocess.Popen double whose stdout records how far it was read."""
+
+    def __init__(self, output: bytes):
+        self.lines = output.splitlines(keepends=True)
+        self.consumed: list[bytes] = []
+        self.terminated = False
+        self.stdout = self._stream()
+
+    def _stream(self):
+        for line in self.lines:
+            self.consumed.append(line)
+            yield line
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def terminate(self):
+        self.terminated = True
+
+
+class TestIwBandParsing:
+    """Test band detection from iw phy text output."""
+
+    def test_parse_iw_bands(self):
+        """Test band headers map to labels in band order."""
+        assert warpie_config._parse_iw_bands(b"\tBand 2:\n\tBand 1:\n") == ["2.4GHz", "5GHz"]
+        assert warpie_config._parse_iw_bands(b"\t\tBand 1: nested\n") == []
+
+    def test_scan_all_bands_multi_phy(self, mocker):
+        """Test one iw phy run yields the bands of every phy."""
+        mocker.patch.object(
+            warpie_config.subprocess,
+            "run",
+            return_value=subprocess.CompletedProcess(["iw", "phy"], 0, IW_PHY_DUMP),
+        )
+        assert warpie_config._scan_all_bands() == {
+            "phy0": ["2.4GHz", "5GHz"],
+            "phy1": ["2.4GHz", "5GHz", "6GHz"],
+        }
+
+    def test_scan_all_bands_without_iw(self, mocker):
+        """Test a missing iw binary yields no phys."""
+        mocker.patch.object(warpie_config.subprocess, "run", side_effect=FileNotFoundError)
+        assert warpie_config._scan_all_bands() == {}
+
+    def test_iw_phy_bands_stops_at_supported_commands(self, mocker):
+        """Test streaming stops reading once the band sections are over."""
+        proc = FakePopen(IW_PHY_INFO)
+        popen = mocker.patch.object(warpie_config.subprocess, "Popen", return_value=proc)
+        mocker.patch.object(warpie_config, "_read_sysfs", return_value="phy2")
+
+        assert warpie_config._iw_phy_bands("/sys/class/net/wlan2/phy80211") == ["2.4GHz"]
+        assert popen.call_args.args[0] == ["iw", "phy", "phy2", "info"]
+        assert proc.consumed[-1] == b"\tSupported commands:\n"
+        assert proc.terminated
+
+    def test_iw_phy_bands_stops_once_all_bands_found(self, mocker):
+        """Test streaming stops at the last possible band header."""
+        proc = FakePopen(b"Wiphy phy1\n\tBand 1:\n\tBand 2:\n\tBand 4:\n\t\tFrequencies:\n")
+        mocker.patch.object(warpie_config.subprocess, "Popen", return_value=proc)
+        mocker.patch.object(warpie_config, "_read_sysfs", return_value="phy1")
+
+        assert warpie_config._iw_phy_bands("/sys/class/net/wlan1/phy80211") == [
+            "2.4GHz",
+            "5GHz",
+            "6GHz",
+        ]
+        assert proc.consumed[-1] == b"\tBand 4:\n"
+
+
+# =============================================================================
+# ADAPTER CACHE TESTS
+# =============================================================================
+
+
+CACHE_INTERFACES = [("wlan0", "/sys/class/net/wlan0"), ("wlan1", "/sys/class/net/wlan1")]
+CACHE_KEY = "wlan0,wlan1@1700000000"
+
+
+class TestAdapterCache:
+    """Test the band cache behind detect_wifi_interfaces."""
+
+    @pytest.fixture
+    def cache_file(self, tmp_path, mocker):
+        """Point the cache at a temporary file and fix the interface scan."""
+        cache_file = tmp_path / "adapters.cache.json"
+        mocker.patch.object(warpie_config, "ADAPTER_CACHE", str(cache_file))
+        mocker.patch.object(
+            warpie_config,
+            "_list_wireless_interfaces",
+            return_value=(CACHE_INTERFACES, CACHE_KEY),
+        )
+        return cache_file
+
+    def _mock_sysfs(self, mocker, wlan0_mac="aa:bb:cc:dd:ee:00"):
+        """Return fresh MAC/driver/phy reads for both interfaces."""
+        return mocker.patch.object(
+            warpie_config,
+            "_read_interfaces",
+            return_value=[
+                ("wlan0", wlan0_mac, "mt76x2u", 0),
+                ("wlan1", "aa:bb:cc:dd:ee:01", "rtl8xxxu", 1),
+            ],
+        )
+
+    def test_cache_miss_detects_and_saves_bands(self, cache_file, mocker):
+        """Test a miss runs band detection and stores only bands."""
+        self._mock_sysfs(mocker)
+        dump = mocker.patch.object(
+            warpie_config, "_dump_phy_bands", return_value={0: ["2.4GHz", "5GHz"]}
+        )
+
+        adapters = warpie_config.detect_wifi_interfaces()
+
+        assert [(a.interface, a.bands) for a in adapters] == [
+            ("wlan0", ["2.4GHz", "5GHz"]),
+            ("wlan1", ["2.4GHz"]),
+        ]
+        dump.assert_called_once()
+        assert json.loads(cache_file.read_text()) == {
+            "key": CACHE_KEY,
+            "bands": {"wlan0": ["2.4GHz", "5GHz"], "wlan1": ["2.4GHz"]},
+        }
+
+    def test_cache_hit_rereads_mac_and_driver(self, cache_file, mocker):
+        """Test a hit skips band detection but reports the current MAC."""
+        cache_file.write_text(
+            json.dumps(
+                {"key": CACHE_KEY, "bands": {"wlan0": ["2.4GHz", "5GHz"], "wlan1": ["2.4GHz"]}}
+            )
+        )
+        read = self._mock_sysfs(mocker, wlan0_mac="02:11:22:33:44:55")
+        dump = mocker.patch.object(warpie_config, "_dump_phy_bands")
+
+        adapters = warpie_config.detect_wifi_interfaces()
+
+        read.assert_called_once_with(CACHE_INTERFACES)
+        dump.assert_not_called()
+        assert adapters[0].mac == "02:11:22:33:44:55"
+        assert adapters[0].bands == ["2.4GHz", "5GHz"]
+        assert adapters[1].driver == "rtl8xxxu"
+
+    def test_cache_key_mismatch_is_a_miss(self, cache_file, mocker):
+        """Test a cache written for another adapter set is ignored."""
+        cache_file.write_text(json.dumps({"key": "wlan0@1", "bands": {"wlan0": ["6GHz"]}}))
+        self._mock_sysfs(mocker)
+        mocker.patch.object(warpie_config, "_dump_phy_bands", return_value={0: ["2.4GHz"]})
+
+        adapters = warpie_config.detect_wifi_interfaces()
+
+        assert adapters[0].bands == ["2.4GHz"]
+        assert json.loads(cache_file.read_text())["key"] == CACHE_KEY
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            "{not json",
+            '{"key": "wlan0,wlan1@1700000000", "bands": ["2.4GHz"]}',
+            '{"key": "wlan0,wlan1@1700000000", "bands": {"wlan0": "5GHz"}}',
+            '{"key": "wlan0,wlan1@1700000000", "adapters": []}',
+        ],
+    )
+    def test_corrupt_cache_is_a_miss(self, cache_file, mocker, content):
+        """Test unreadable or old-format cache files fall back to detection."""
+        cache_file.write_text(content)
+        self._mock_sysfs(mocker)
+        dump = mocker.patch.object(
+            warpie_config, "_dump_phy_bands", return_value={0: ["2.4GHz", "5GHz"]}
+        )
+
+        adapters = warpie_config.detect_wifi_interfaces()
+
+        dump.assert_called_once()
+        assert adapters[0].bands == ["2.4GHz", "5GHz"]
+
+
+# =============================================================================
+# MAIN FLOW TESTS
+# =============================================================================
+
+
+class TestMain:
+    """Test the configurator entry point."""
+
+    def test_no_wifi_exit_does_not_wait_for_btle(self):
+        """Test the no-WiFi exit isn't held up by a slow BTLE helper."""
+        # Interpreter shutdown is what joined the old worker, so run main()
+        # in a child process and require it to exit well before the helper
+        script = f"""
+import sys
+import time
+from unittest import mock
+
+sys.path.insert(0, {str(install_path)!r})
+import warpie_config
+
+with (
+    mock.patch.object(warpie_config, "_ensure_dependencies"),
+    mock.patch.object(warpie_config, "_console"),
+    mock.patch.object(warpie_config, "detect_wifi_interfaces", return_value=[]),
+    mock.patch.object(warpie_config, "detect_btle_adapters", lambda: time.sleep(120)),
+):
+    warpie_config.main()
+"""
+        result = subprocess.run([sys.executable, "-c", script], check=False, timeout=30)
+        assert result.returncode == 1
+
+
+# =============================================================================
+# HOME WIFI TESTS
+# =============================================================================
+
+
+class TestWpaPsk:
+    """Test the in-process WPA PSK derivation."""
+
+    def test_ieee_80211i_vector(self):
+        """Test the IEEE 802.11i PBKDF2 test vector."""
+        assert (
+            warpie_config._wpa_psk("IEEE", "password")
+            == "f42c6fc52df0ebef9ebb4b90b38a5f902e83fe1b135a70e23aed762e9710a12e"
+        )
+
+    def test_ieee_80211i_second_vector(self):
+        """Test the second IEEE 802.11i vector (longer SSID and passphrase)."""
+        assert (
+            warpie_config._wpa_psk("ThisIsASSID", "ThisIsAPassword")
+            == "0dc0d6eb90555ed6419756b9a15ec3e3209b63df707dd508d14581f8982721af"
+        )
+
+
+# =============================================================================
+# SAVE CONFIG TESTS
+# =============================================================================
+
+
+@pytest.fixture
+def adapter_setup():
+    """An AP adapter plus two capture configs: a locked 2.4GHz and a tri-band hopper."""
+    ap = warpie_config.WifiAdapter(
+        interface="wlan0", mac="aa:bb:cc:00:00:01", driver="brcmfmac", bands=["2.4GHz", "5GHz"]
+    )
+    configs = [
+        warpie_config.AdapterConfig(
+            interface="wlan1",
+            mac="aa:bb:cc:00:00:02",
+            name="WiFi_24GHz_0",
+            enabled_bands=["2.4GHz"],
+            channels_24="6",
+        ),
+        warpie_config.AdapterConfig(
+            interface="wlan2",
+            mac="aa:bb:cc:00:00:0f",
+            name="WiFi_TriBand_1",
+            enabled_bands=["2.4GHz", "5GHz", "6GHz"],
+            channels_24="1,6,11",
+            channels_5="36,40,44,48",
+            channels_6=warpie_config.CHANNELS_6_PSC,
+        ),
+    ]
+    return ap, configs
+
+
+class TestSaveConfig:
+    """Test adapters.conf writing."""
+
+    @pytest.fixture(autouse=True)
+    def _quiet_console(self, mocker):
+        """Silence the rich console save_config prints to."""
+        mocker.patch.object(warpie_config, "_console")
+
+    def test_successful_write_leaves_no_temp_file(self, tmp_path, adapter_setup):
+        """Test a completed save renames the temp file into place."""
+        output = tmp_path / "adapters.conf"
+        output.write_text("OLD\n")
+
+        warpie_config.save_config(*adapter_setup, output_path=str(output))
+
+        assert output.read_text().startswith("# WarPie Adapter Configuration\n")
+        assert list(tmp_path.glob("*.tmp")) == []
+
+    def test_failed_write_keeps_old_config(self, tmp_path, adapter_setup, mocker):
+        """Test an error after the header is written leaves the old file intact."""
+        output = tmp_path / "adapters.conf"
+        output.write_text("OLD\n")
+        # Header renders fine, then the first adapter block raises mid-write
+        mocker.patch.object(warpie_config, "CONFIG_ADAPTER_TEMPLATE", "{missing}")
+
+        with pytest.raises(KeyError):
+            warpie_config.save_config(*adapter_setup, output_path=str(output))
+
+        assert output.read_text() == "OLD\n"
+        assert list(tmp_path.glob("*.tmp")) == []
+
+    def test_failed_rename_is_raised(self, tmp_path, adapter_setup, mocker):
+        """Test a failing rename surfaces the error and cleans up the temp file."""
+        output = tmp_path / "adapters.conf"
+        output.write_text("OLD\n")
+        mocker.patch.object(
+            warpie_config.Path, "replace", side_effect=OSError(errno.EXDEV, "cross-device")
+        )
+
+        with pytest.raises(OSError) as exc_info:
+            warpie_config.save_config(*adapter_setup, output_path=str(output))
+
+        assert exc_info.value.errno == errno.EXDEV
+        assert output.read_text() == "OLD\n"
+        assert list(tmp_path.glob("*.tmp")) == []
+
+    @pytest.mark.parametrize(("fsync", "calls"), [(False, 0), (True, 1)])
+    def test_fsync_only_on_request(self, tmp_path, adapter_setup, mocker, fsync, calls):
+        """Test the temp file is fsynced exactly once with fsync=True, never by default."""
+        os_fsync = mocker.patch.object(warpie_config.os, "fsync")
+        kwargs = {"fsync": True} if fsync else {}
+
+        warpie_config.save_config(
+            *adapter_setup, output_path=str(tmp_path / "adapters.conf"), **kwargs
+        )
+
+        assert os_fsync.call_count == calls
+
+    def test_rendered_output(self, tmp_path, adapter_setup):
+        """Test the full adapters.conf text install.sh sources (MACs uppercased)."""
+        output = tmp_path / "adapters.conf"
+
+        warpie_config.save_config(
+            *adapter_setup,
+            home_wifi={"ssid": "HomeNet", "psk": "ab" * 32},
+            kismet_autostart=True,
+            kismet_startup_mode="targeted",
+            btle_config={"enabled": "true", "device": "ticc2540-1-5"},
+            output_path=str(output),
+        )
+
+        assert output.read_text() == (
+            "# WarPie Adapter Configuration\n"
+            "# Generated by warpie_config.py\n"
+            "\n"
+            'WIFI_AP="wlan0"\n'
+            'WIFI_AP_MAC="AA:BB:CC:00:00:01"\n'
+            "\n"
+            "# Home WiFi Configuration\n"
+            'HOME_WIFI_ENABLED="true"\n'
+            'HOME_WIFI_SSID="HomeNet"\n'
+            f'HOME_WIFI_PSK="{"ab" * 32}"\n'
+            "\n"
+            "# BTLE Configuration (TI CC2540)\n"
+            'BTLE_ENABLED="true"\n'
+            'BTLE_DEVICE="ticc2540-1-5"\n'
+            "\n"
+            "# Kismet Configuration\n"
+            'KISMET_AUTOSTART="true"\n'
+            'KISMET_STARTUP_MODE="targeted"\n'
+            "\n"
+            "WIFI_CAPTURE_COUNT=2\n"
+            "\n"
+            'ADAPTER_0_IFACE="wlan1"\n'
+            'ADAPTER_0_MAC="AA:BB:CC:00:00:02"\n'
+            'ADAPTER_0_NAME="WiFi_24GHz_0"\n'
+            'ADAPTER_0_BANDS="2.4GHz"\n'
+            'ADAPTER_0_CHANNELS_24="6"\n'
+            'ADAPTER_0_CHANNELS_5=""\n'
+            'ADAPTER_0_CHANNELS_6=""\n'
+            "\n"
+            'ADAPTER_1_IFACE="wlan2"\n'
+            'ADAPTER_1_MAC="AA:BB:CC:00:00:0F"\n'
+            'ADAPTER_1_NAME="WiFi_TriBand_1"\n'
+            'ADAPTER_1_BANDS="2.4GHz,5GHz,6GHz"\n'
+            'ADAPTER_1_CHANNELS_24="1,6,11"\n'
+            'ADAPTER_1_CHANNELS_5="36,40,44,48"\n'
+            'ADAPTER_1_CHANNELS_6="5,21,37,53,69,85,101,117,133,149,165,181,197,213,229"\n'
+        )
+
+    def test_disabled_options_render_defaults(self, tmp_path, adapter_setup):
+        """Test no home WiFi/BTLE and manual Kismet start render as disabled."""
+        output = tmp_path / "adapters.conf"
+
+        warpie_config.save_config(
+            adapter_setup[0], [], kismet_autostart=False, output_path=str(output)
+        )
+
+        text = output.read_text()
+        assert 'HOME_WIFI_ENABLED="false"\nHOME_WIFI_SSID=""\nHOME_WIFI_PSK=""\n' in text
+        assert 'BTLE_ENABLED="false"\nBTLE_DEVICE=""\n' in text
+        assert 'KISMET_AUTOSTART="false"\nKISMET_STARTUP_MODE="wardrive"\n' in text
+        assert text.endswith("WIFI_CAPTURE_COUNT=0\n")
+
+
+# =============================================================================
+# SYSFS INTERFACE DISCOVERY TESTS
+# =============================================================================
+
+
+class TestSysfsInterfaces:
+    """Test interface discovery against a fake /sys/class/net tree."""
+
+    @pytest.fixture
+    def sysfs(self, tmp_path, mocker):
+        """Fake sysfs: net/ holds interface symlinks into devices/, as on Linux."""
+        net = tmp_path / "net"
+        net.mkdir()
+        (tmp_path / "devices").mkdir()
+        (tmp_path / "drivers" / "mt76x2u").mkdir(parents=True)
+        # Plain file in /sys/class/net that is not an interface
+        (net / "bonding_masters").write_text("\n")
+        mocker.patch.object(warpie_config, "SYSFS_NET", str(net))
+        return tmp_path
+
+    @staticmethod
+    def add_interface(sysfs, name, *, mac, phy_index=None, driver=None):
+        """Create an interface; phy_index=None means not wireless."""
+        device = sysfs / "devices" / name
+        device.mkdir()
+        (device / "address").write_text(f"{mac}\n")
+        if phy_index is not None:
+            phy = sysfs / "devices" / f"phy{phy_index}"
+            phy.mkdir()
+            (phy / "index").write_text(f"{phy_index}\n")
+            (device / "phy80211").symlink_to(phy)
+        if driver is not None:
+            (device / "device").mkdir()
+            (device / "device" / "driver").symlink_to(sysfs / "drivers" / driver)
+        (sysfs / "net" / name).symlink_to(device)
+
+    def test_skips_interfaces_without_phy80211(self, sysfs):
+        """Test only cfg80211 interfaces are listed, sorted by name."""
+        self.add_interface(sysfs, "wlan1", mac="aa:bb:cc:dd:ee:01", phy_index=1)
+        self.add_interface(sysfs, "eth0", mac="aa:bb:cc:dd:ee:99")
+        self.add_interface(sysfs, "wlan0", mac="aa:bb:cc:dd:ee:00", phy_index=0)
+
+        interfaces, _ = warpie_config._list_wireless_interfaces()
+
+        net = sysfs / "net"
+        assert interfaces == [("wlan0", str(net / "wlan0")), ("wlan1", str(net / "wlan1"))]
+
+    def test_reads_mac_driver_and_phy_index(self, sysfs):
+        """Test the trailing newline is stripped and a missing driver link is tolerated."""
+        self.add_interface(sysfs, "wlan0", mac="aa:bb:cc:dd:ee:00", phy_index=0, driver="mt76x2u")
+        self.add_interface(sysfs, "wlan1", mac="aa:bb:cc:dd:ee:01", phy_index=1)
+
+        interfaces, _ = warpie_config._list_wireless_interfaces()
+
+        assert warpie_config._read_interfaces(interfaces) == [
+            ("wlan0", "aa:bb:cc:dd:ee:00", "mt76x2u", 0),
+            ("wlan1", "aa:bb:cc:dd:ee:01", "unknown", 1),
+        ]
+
+    def test_unreadable_address_falls_back(self, sysfs):
+        """Test an interface without an address file gets the placeholder MAC."""
+        self.add_interface(sysfs, "wlan0", mac="aa:bb:cc:dd:ee:00", phy_index=0)
+        (sysfs / "devices" / "wlan0" / "address").unlink()
+
+        interfaces, _ = warpie_config._list_wireless_interfaces()
+
+        assert warpie_config._read_interfaces(interfaces)[0][1] == warpie_config.UNKNOWN_MAC
+
+    def test_cache_key_changes_when_interface_added(self, sysfs):
+        """Test plugging in another adapter yields a different cache key."""
+        self.add_interface(sysfs, "wlan0", mac="aa:bb:cc:dd:ee:00", phy_index=0)
+        _, key_before = warpie_config._list_wireless_interfaces()
+        _, key_again = warpie_config._list_wireless_interfaces()
+
+        self.add_interface(sysfs, "wlan1", mac="aa:bb:cc:dd:ee:01", phy_index=1)
+        _, key_after = warpie_config._list_wireless_interfaces()
+
+        assert key_before == key_again
+        assert key_after != key_before
+        assert key_after.startswith("wlan0,wlan1@")
+
+
+# =============================================================================
+# SINGLE-BAND DRIVER TESTS
+# =============================================================================
+
+
+class TestSingleBandDrivers:
+    """Test band detection is skipped for drivers with a known, fixed band."""
+
+    @pytest.fixture
+    def probes(self, mocker):
+        """Make every band probe fail loudly unless a test opts in."""
+        return {
+            name: mocker.patch.object(
+                warpie_config, name, side_effect=AssertionError(f"{name} called")
+            )
+            for name in ("_dump_phy_bands", "_scan_all_bands", "detect_bands")
+        }
+
+    def test_all_single_band_skips_probes(self, probes):
+        """Test an rtl8xxxu-only setup never touches nl80211 or iw."""
+        found = [
+            ("wlan0", "aa:bb:cc:dd:ee:00", "rtl8xxxu", 0),
+            ("wlan1", "aa:bb:cc:dd:ee:01", "rtl8xxxu", 1),
+        ]
+
+        adapters = warpie_config._detect_adapters(found)
+
+        assert [a.bands for a in adapters] == [["2.4GHz"], ["2.4GHz"]]
+        for probe in probes.values():
+            probe.assert_not_called()
+
+    def test_mixed_drivers_still_dump(self, probes):
+        """Test a dual-band adapter alongside rtl8xxxu still gets its bands dumped."""
+        probes["_dump_phy_bands"].side_effect = None
+        probes["_dump_phy_bands"].return_value = {1: ["2.4GHz", "5GHz"]}
+        found = [
+            ("wlan0", "aa:bb:cc:dd:ee:00", "rtl8xxxu", 0),
+            ("wlan1", "aa:bb:cc:dd:ee:01", "mt76x2u", 1),
+        ]
+
+        adapters = warpie_config._detect_adapters(found)
+
+        assert [a.bands for a in adapters] == [["2.4GHz"], ["2.4GHz", "5GHz"]]
+        probes["_dump_phy_bands"].assert_called_once_with()
+        probes["_scan_all_bands"].assert_not_called()
+
+
+# =============================================================================
+# BTLE DETECTION TESTS
+# =============================================================================
+
+TICC_LIST_OUTPUT = (
+    b"Supported interfaces:\n"
+    b"ticc2540-1-5 (ticc2540)\n"
+    b"    ticc2540-3-1.2 (ticc2540)\n"
+    b"ticc2540-2-1\n"
+    b"ticc2540-2-2 (other)\n"
+)
+
+
+class TestDetectBtleAdapters:
+    """Test parsing of kismet_cap_ti_cc_2540 --list output."""
+
+    def test_parses_listed_devices(self, mocker):
+        """Test indented lines are accepted and malformed lines are ignored."""
+        mocker.patch.object(
+            warpie_config.subprocess,
+            "run",
+            return_value=subprocess.CompletedProcess([], 0, b"", TICC_LIST_OUTPUT),
+        )
+
+        adapters = warpie_config.detect_btle_adapters()
+
+        assert [(a.device_id, a.usb_path) for a in adapters] == [
+            ("ticc2540-1-5", "1-5"),
+            ("ticc2540-3-1.2", "3-1.2"),
+        ]
+
+    def test_falls_back_to_stdout(self, mocker):
+        """Test the device list is read from stdout when stderr is empty."""
+        mocker.patch.object(
+            warpie_config.subprocess,
+            "run",
+            return_value=subprocess.CompletedProcess([], 0, TICC_LIST_OUTPUT, b""),
+        )
+
+        assert len(warpie_config.detect_btle_adapters()) == 2
+
+    def test_missing_helper_returns_empty(self, mocker):
+        """Test a missing kismet_cap_ti_cc_2540 binary means no adapters."""
+        mocker.patch.object(warpie_config.subprocess, "run", side_effect=FileNotFoundError)
+
+        assert warpie_config.detect_btle_adapters() == []
+
+    def test_unexpected_errors_propagate(self, mocker):
+        """Test errors other than failing to run the helper are not swallowed."""
+        mocker.patch.object(warpie_config.subprocess, "run", side_effect=RuntimeError("boom"))
+
+        with pytest.raises(RuntimeError, match="boom"):
+            warpie_config.detect_btle_adapters()
@@ -12,15 +12,11 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from web.app import create_app
-
 
 @pytest.fixture
-def app():
-    """Create a test Flask application instance."""
-    app = create_app()
-    app.config["TESTING"] = True
-    return app
+def app(flask_app):
+    """Test Flask application instance (session-scoped, see conftest.py)."""
+    return flask_app
 
 
 @pytest.fixture